@@ -17,12 +17,22 @@ from typing import Optional, Tuple, Dict, Any, List
 from base_ai_comm import BaseLogReader, BaseCommunicator
 from ccb_config import apply_backend_env
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 apply_backend_env()
 
 GEMINI_ROOT = Path(os.environ.get("GEMINI_ROOT") or (Path.home() / ".gemini" / "tmp")).expanduser()
 
 
+# json.dumps builds a fresh JSONEncoder per call; reuse one for session writes
+_SESSION_ENCODE = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+
 def _get_project_hash(work_dir: Optional[Path] = None) -> str:
     """Calculate project directory hash (consistent with gemini-cli's Storage.getFilePathHash)"""
     path = work_dir or Path.cwd()
@@ -610,6 +620,12 @@ class GeminiLogReader(BaseLogReader):
 class GeminiCommunicator(BaseCommunicator):
     """Communicate with Gemini via terminal and read replies from session files"""
 
+    # Lazily opened directory fd + cached existence flag so health checks
+    # don't re-resolve the runtime dir path on every call.
+    _runtime_dir_fd: Optional[int] = None
+    _runtime_dir_exists: Optional[bool] = None
+    _reader_cache: Optional[Dict[Tuple[Optional[str], Optional[str]], GeminiLogReader]] = None
+
     @property
     def provider_name(self) -> str:
         return "Gemini"
@@ -658,19 +674,52 @@ class GeminiCommunicator(BaseCommunicator):
 
     def _create_log_reader(self) -> GeminiLogReader:
         work_dir_hint = self.session_info.get("work_dir")
+        preferred_session = self.session_info.get("gemini_session_path") or self.session_info.get("session_path")
+        # Readers rescan the log directory on construction; reuse one per
+        # (work_dir, preferred_session) pair instead of rebuilding each time.
+        cache_key = (
+            work_dir_hint if isinstance(work_dir_hint, str) else None,
+            str(preferred_session) if preferred_session else None,
+        )
+        if self._reader_cache is None:
+            self._reader_cache = {}
+        cached = self._reader_cache.get(cache_key)
+        if cached is not None:
+            return cached
         log_work_dir = Path(work_dir_hint) if isinstance(work_dir_hint, str) and work_dir_hint else None
         reader = GeminiLogReader(work_dir=log_work_dir)
-        preferred_session = self.session_info.get("gemini_session_path") or self.session_info.get("session_path")
         if preferred_session:
             reader.set_preferred_log(Path(str(preferred_session)))
+        self._reader_cache[cache_key] = reader
         return reader
 
     def _raise_no_session_error(self):
         raise RuntimeError("❌ No active Gemini session found, please run ccb up gemini first")
 
+    def _runtime_dir_alive(self, probe: bool) -> bool:
+        """Cached runtime-dir existence check.
+
+        Holds a directory fd so that re-probes are a single fstat (checking
+        st_nlink catches deletion of the still-open directory) instead of a
+        full path resolution per health check.
+        """
+        if self._runtime_dir_exists is None or probe:
+            if self._runtime_dir_fd is None:
+                try:
+                    flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+                    self._runtime_dir_fd = os.open(str(self.runtime_dir), flags)
+                except OSError:
+                    self._runtime_dir_exists = self.runtime_dir.exists()
+                    return self._runtime_dir_exists
+            try:
+                self._runtime_dir_exists = os.fstat(self._runtime_dir_fd).st_nlink > 0
+            except OSError:
+                self._runtime_dir_exists = False
+        return self._runtime_dir_exists
+
     def _check_session_health_impl(self, probe_terminal: bool) -> Tuple[bool, str]:
         try:
-            if not self.runtime_dir.exists():
+            if not self._runtime_dir_alive(probe_terminal):
                 return False, "Runtime directory not found"
             if not self.pane_id:
                 return False, "Session ID not found"
@@ -712,8 +761,11 @@ class GeminiCommunicator(BaseCommunicator):
             return
 
         try:
-            with project_file.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            if HAS_ORJSON:
+                data = orjson.loads(project_file.read_bytes())
+            else:
+                with project_file.open("r", encoding="utf-8") as handle:
+                    data = json.load(handle)
         except Exception:
             return
 
@@ -733,7 +785,10 @@ class GeminiCommunicator(BaseCommunicator):
 
         session_id = ""
         try:
-            payload = json.loads(session_path.read_text(encoding="utf-8"))
+            if HAS_ORJSON:
+                payload = orjson.loads(session_path.read_bytes())
+            else:
+                payload = json.loads(session_path.read_text(encoding="utf-8"))
             if isinstance(payload, dict) and isinstance(payload.get("sessionId"), str):
                 session_id = payload["sessionId"]
         except Exception:
@@ -745,24 +800,27 @@ class GeminiCommunicator(BaseCommunicator):
         if not updated:
             return
 
+        # Always write a temp file and rename it in: other ccb commands read
+        # this file concurrently and must never observe a partial write.
         tmp_file = project_file.with_suffix(".tmp")
         try:
-            with tmp_file.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, ensure_ascii=False, indent=2)
+            if HAS_ORJSON:
+                tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with tmp_file.open("w", encoding="utf-8") as handle:
+                    handle.write(_SESSION_ENCODE(data))
             os.replace(tmp_file, project_file)
         except PermissionError as e:
             print(f"⚠️  Cannot update {project_file.name}: {e}", file=sys.stderr)
             print(f"💡 Try: sudo chown $USER:$USER {project_file}", file=sys.stderr)
             try:
-                if tmp_file.exists():
-                    tmp_file.unlink(missing_ok=True)
+                tmp_file.unlink(missing_ok=True)
             except Exception:
                 pass
         except Exception as e:
             print(f"⚠️  Failed to update {project_file.name}: {e}", file=sys.stderr)
             try:
-                if tmp_file.exists():
-                    tmp_file.unlink(missing_ok=True)
+                tmp_file.unlink(missing_ok=True)
             except Exception:
                 pass
 
@@ -793,9 +851,10 @@ def main() -> int:
             comm.ping()
         elif args.status:
             status = comm.get_status()
-            print("📊 Gemini status:")
-            for key, value in status.items():
-                print(f"   {key}: {value}")
+            # Emit in one write instead of one syscall per line
+            lines = ["📊 Gemini status:"]
+            lines.extend(f"   {key}: {value}" for key, value in status.items())
+            print("\n".join(lines))
         elif args.pending:
             comm.consume_pending()
         elif args.question:
@@ -9,9 +9,13 @@ Language detection priority:
 
 import os
 import locale
+import re
 
 _current_lang = None
 
+# Matches locales like "zh_CN.UTF-8" or names containing "chinese" in one pass
+_ZH_LOCALE_RE = re.compile(r"^zh|chinese", re.IGNORECASE)
+
 MESSAGES = {
     "en": {
         # Terminal detection
@@ -202,8 +206,7 @@ def detect_language() -> str:
             lang, _ = locale.getdefaultlocale()
             lang = lang or ""
 
-        lang = lang.lower()
-        if lang.startswith("zh") or "chinese" in lang:
+        if _ZH_LOCALE_RE.search(lang):
             return "zh"
     except Exception:
         pass
@@ -70,10 +70,13 @@ def prompt_choice(prompt: str, choices: List[str], default: Optional[str] = None
             print("Error: No choices available in non-interactive mode")
             sys.exit(1)
 
-    print(f"\n{prompt}")
-    for i, choice in enumerate(choices, 1):
-        marker = " (recommended)" if choice == default else ""
-        print(f"  {i}. {choice}{marker}")
+    # Build the menu once and emit it with a single write
+    lines = [f"\n{prompt}"]
+    lines.extend(
+        f"  {i}. {choice}{' (recommended)' if choice == default else ''}"
+        for i, choice in enumerate(choices, 1)
+    )
+    print("\n".join(lines))
 
     # Calculate default index safely
     default_idx = None
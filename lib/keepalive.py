@@ -7,9 +7,41 @@ When AI declares "Next: xxx" but stops responding, send a reminder after delay.
 from __future__ import annotations
 import os
 import re
+import sys
 import time
 from dataclasses import dataclass
-from typing import Dict, Optional, Callable, List
+from typing import Optional, Callable, List
+
+
+# Match "Next:" or "- Next:" or "* Next:" patterns.
+# Module-level so _extract_next skips a class-attribute lookup per call.
+NEXT_RE = re.compile(r"(?mi)^\s*(?:[-*]\s*)?Next\s*(?:\(|:)\s*(.+)$")
+
+# Prefer google-re2 when installed: its DFA guarantees linear-time matching
+# on arbitrary AI output, where the stdlib backtracking engine is superlinear
+# in the worst case. Drop-in for the search/group API used here.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Regex reference path (CCB_KEEPALIVE_USE_REGEX=1), split per declaration
+# form so the engine never explores the (:|\() alternation, and anchored
+# with [ \t] rather than \s so matches cannot gobble across newlines.
+_NEXT_COLON = _re_engine.compile(r"(?mi)^[ \t]*(?:[-*][ \t]*)?Next[ \t]*:[ \t]*(.+)$")
+_NEXT_PAREN = _re_engine.compile(r"(?mi)^[ \t]*(?:[-*][ \t]*)?Next[ \t]*\([ \t]*(.+)$")
+
+
+def _extract_next_regex(text: str) -> str:
+    """Regex-based extraction kept as the reference implementation."""
+    match = _NEXT_COLON.search(text)
+    if match is None and "(" in text:
+        match = _NEXT_PAREN.search(text)
+    return match.group(1).strip() if match else ""
+
+# "Next:" declarations conventionally sit at the end of a reply, so only the
+# tail is scanned. Tunable via CCB_KEEPALIVE_TAIL_BYTES (0 disables the bound).
+_DEFAULT_TAIL_CHARS = 2048
 
 
 def _env_float(name: str, default: float) -> float:
@@ -30,12 +62,54 @@ def _env_bool(name: str, default: bool = False) -> bool:
     return default
 
 
-@dataclass
+# Env tunables resolved once at import; Keepalive.reload_env() refreshes them
+# for tests that mutate os.environ. None means "not set, use the argument".
+_DELAY_OVERRIDE: Optional[float] = None
+_ENABLED_OVERRIDE: Optional[bool] = None
+_TAIL_CHARS: int = _DEFAULT_TAIL_CHARS
+_USE_REGEX: bool = False
+
+
+def _reload_env_defaults() -> None:
+    """Parse keepalive env tunables once instead of on every instantiation."""
+    global _DELAY_OVERRIDE, _ENABLED_OVERRIDE, _TAIL_CHARS, _USE_REGEX
+    _USE_REGEX = _env_bool("CCB_KEEPALIVE_USE_REGEX", False)
+    raw = os.environ.get("CCB_KEEPALIVE_DELAY")
+    try:
+        _DELAY_OVERRIDE = float(raw) if raw is not None else None
+    except (TypeError, ValueError):
+        _DELAY_OVERRIDE = None
+    raw = os.environ.get("CCB_KEEPALIVE_ENABLED", "").lower()
+    if raw in ("1", "true", "yes", "on"):
+        _ENABLED_OVERRIDE = True
+    elif raw in ("0", "false", "no", "off"):
+        _ENABLED_OVERRIDE = False
+    else:
+        _ENABLED_OVERRIDE = None
+    try:
+        _TAIL_CHARS = int(os.environ.get("CCB_KEEPALIVE_TAIL_BYTES", _DEFAULT_TAIL_CHARS))
+    except (TypeError, ValueError):
+        _TAIL_CHARS = _DEFAULT_TAIL_CHARS
+
+
+_reload_env_defaults()
+
+
+# Interned so provider lookups hit the pointer-equality fast path
+_PROVIDER_NAMES = (sys.intern("codex"), sys.intern("gemini"))
+PROVIDERS = frozenset(_PROVIDER_NAMES)
+# The provider set is fixed, so pending entries live in a flat list and
+# provider names map to stable indices — no string hashing per access.
+_PROVIDER_IDX = {name: idx for idx, name in enumerate(_PROVIDER_NAMES)}
+
+
+@dataclass(frozen=True, slots=True)
 class PendingKeepalive:
     """Pending keepalive entry."""
-    due: float          # Timestamp when keepalive should be sent
+    due: float          # Monotonic timestamp when keepalive should be sent
     next_hint: str      # Content after "Next:" declaration
     provider: str       # "codex" or "gemini"
+    msg: str = ""       # Preformatted keepalive message, built at schedule time
 
 
 class Keepalive:
@@ -54,8 +128,14 @@ class Keepalive:
         keepalive.tick(send_fn, is_busy_fn)
     """
 
-    # Match "Next:" or "- Next:" or "* Next:" patterns
-    NEXT_RE = re.compile(r"(?mi)^\s*(?:[-*]\s*)?Next\s*(?:\(|:)\s*(.+)$")
+    # Kept as a class alias for backward compatibility; the compiled
+    # pattern itself lives at module scope.
+    NEXT_RE = NEXT_RE
+
+    __slots__ = (
+        "delay", "enabled", "_tail_chars", "pending", "_pending_mask",
+        "_clock", "_last_extract",
+    )
 
     def __init__(self, delay_seconds: float = 60.0, enabled: bool = True):
         """
@@ -65,9 +145,28 @@ class Keepalive:
             enabled: Whether keepalive is enabled.
                     Can be overridden by CCB_KEEPALIVE_ENABLED environment variable.
         """
-        self.delay = _env_float("CCB_KEEPALIVE_DELAY", delay_seconds)
-        self.enabled = _env_bool("CCB_KEEPALIVE_ENABLED", enabled)
-        self.pending: Dict[str, Optional[PendingKeepalive]] = {}
+        self.delay = _DELAY_OVERRIDE if _DELAY_OVERRIDE is not None else delay_seconds
+        self.enabled = _ENABLED_OVERRIDE if _ENABLED_OVERRIDE is not None else enabled
+        self._tail_chars = _TAIL_CHARS
+        # One slot per known provider, indexed via _PROVIDER_IDX. With two
+        # fixed slots a flat scan beats both dict hashing and heap upkeep.
+        self.pending: List[Optional[PendingKeepalive]] = [None] * len(_PROVIDER_NAMES)
+        # Bit i set <=> provider i has a pending entry. "Anything pending?"
+        # is one integer test and tick() scans set bits only; a single int
+        # covers up to 64 providers with no per-slot object overhead.
+        self._pending_mask = 0
+        # Per-provider (len, hash, hint) of the last extracted message, so
+        # re-emitted stream tails skip the scan entirely.
+        self._last_extract: List[Optional[tuple]] = [None] * len(_PROVIDER_NAMES)
+        # Deadlines are durations, so use the monotonic clock: immune to NTP
+        # steps and cheaper than time.time() on many platforms. Swappable
+        # (e.g. to a CLOCK_MONOTONIC_COARSE reader) for tick-heavy callers.
+        self._clock: Callable[[], float] = time.monotonic
+
+    @classmethod
+    def reload_env(cls) -> None:
+        """Re-read env tunables (for tests that mutate os.environ)."""
+        _reload_env_defaults()
 
     def _extract_next(self, message: str) -> str:
         """Extract the first "Next:" declaration from message.
@@ -75,39 +174,81 @@ class Keepalive:
         Returns:
             Content after "Next:" or empty string if not found.
         """
-        match = self.NEXT_RE.search(message)
-        if match:
-            return match.group(1).strip()
+        # Only scan the tail: declarations sit at the end of a reply, and this
+        # keeps the cost O(1) for long transcripts full of code blocks.
+        tail = message[-self._tail_chars:] if 0 < self._tail_chars < len(message) else message
+        # Cheap substring gate: messages without "next" (the common case)
+        # never scan line by line.
+        if len(tail) < 5 or "next" not in tail.lower():
+            return ""
+        if _USE_REGEX:
+            return _extract_next_regex(tail)
+        # Hand-coded line scan: the pattern is small enough that C-level str
+        # ops beat the regex engine. Equivalent to the documented NEXT_RE.
+        for line in tail.splitlines():
+            s = line.lstrip()
+            if s[:1] in ("-", "*"):
+                s = s[1:].lstrip()
+            if s[:4].lower() != "next":
+                continue
+            rest = s[4:].lstrip()
+            if rest[:1] in (":", "("):
+                hint = rest[1:].strip()
+                if hint:
+                    return hint
         return ""
 
-    def on_message(self, provider: str, message: str) -> None:
+    def on_message(self, provider: str, message: str, now: Optional[float] = None) -> None:
         """Process AI message and schedule keepalive if "Next:" is declared.
 
         Args:
             provider: "codex" or "gemini"
             message: AI's reply content
+            now: Caller-supplied timestamp to avoid a clock read; event loops
+                 that already know the current time should pass it through.
         """
         if not self.enabled:
             return
 
-        if provider not in ("codex", "gemini"):
+        idx = _PROVIDER_IDX.get(provider)
+        if idx is None:
             return
 
-        next_hint = self._extract_next(message)
+        # Streams often re-emit their final message; only bother hashing
+        # messages long enough for the scan to outweigh the lookup.
+        if len(message) > 256:
+            key = (len(message), hash(message))
+            cached = self._last_extract[idx]
+            if cached is not None and cached[0] == key:
+                next_hint = cached[1]
+            else:
+                next_hint = self._extract_next(message)
+                self._last_extract[idx] = (key, next_hint)
+        else:
+            next_hint = self._extract_next(message)
         if next_hint:
-            self.pending[provider] = PendingKeepalive(
-                due=time.time() + self.delay,
+            if now is None:
+                now = self._clock()
+            # Format once here (the cold path) so tick() just reads and sends
+            self.pending[idx] = PendingKeepalive(
+                due=now + self.delay,
                 next_hint=next_hint,
-                provider=provider
+                provider=provider,
+                msg=f"[KEEPALIVE] Continue: {next_hint}",
             )
+            self._pending_mask |= 1 << idx
         else:
             # No "Next:" declaration, cancel any pending keepalive
-            self.pending[provider] = None
+            self.pending[idx] = None
+            self._pending_mask &= ~(1 << idx)
 
     def tick(
         self,
         send_fn: Callable[[str, str], None],
-        is_busy_fn: Optional[Callable[[str], bool]] = None
+        is_busy_fn: Optional[Callable[[str], bool]] = None,
+        now: Optional[float] = None,
+        on_error: Optional[Callable[[str, BaseException], None]] = None,
+        send_batch_fn: Optional[Callable[[List[tuple]], None]] = None,
     ) -> List[str]:
         """Check and send due keepalives.
 
@@ -115,58 +256,99 @@ class Keepalive:
             send_fn: Function to send message (provider, message) -> None
             is_busy_fn: Optional function to check if provider is busy (provider) -> bool
                        If busy, skip sending and cancel the pending keepalive.
+            now: Caller-supplied timestamp; loops ticking at high frequency
+                 can pass one cached reading per iteration.
+            on_error: Called with (provider, exception) when send_fn raises;
+                      without it failures are dropped, which hides transport
+                      bugs — pass a logger hook in long-running loops.
+            send_batch_fn: Optional fan-out taking [(provider, message), ...]
+                           in one call so the transport can coalesce writes;
+                           when given it replaces the per-item send_fn loop.
 
         Returns:
             List of providers that received keepalive messages.
         """
-        if not self.enabled:
+        mask = self._pending_mask
+        if not self.enabled or not mask:
             return []
 
-        sent_to = []
-        now = time.time()
-
-        for provider in list(self.pending.keys()):
-            pending = self.pending.get(provider)
+        sent_to: List[str] = []
+        # Allocated lazily: ticks where nothing is due make no throwaway list
+        to_send: Optional[List[tuple]] = None
+        if now is None:
+            now = self._clock()
+
+        # Local bindings keep the loop free of repeated attribute/global lookups
+        pending_list = self.pending
+        # Scan only set bits: isolate the lowest bit, map it to a slot index
+        while mask:
+            bit = mask & -mask
+            mask -= bit
+            idx = bit.bit_length() - 1
+            pending = pending_list[idx]
             if pending is None:
+                self._pending_mask &= ~bit
                 continue
 
             # Not due yet
             if now < pending.due:
                 continue
 
+            provider = _PROVIDER_NAMES[idx]
+
             # Check if busy (skip if busy)
             if is_busy_fn and is_busy_fn(provider):
-                self.pending[provider] = None
+                pending_list[idx] = None
+                self._pending_mask &= ~bit
                 continue
 
-            # Build and send keepalive message
-            if pending.next_hint:
-                msg = f"[KEEPALIVE] Continue: {pending.next_hint}"
-            else:
-                msg = "[KEEPALIVE] Continue your work."
-
-            try:
-                send_fn(provider, msg)
-                sent_to.append(provider)
-            except Exception:
-                pass
+            # Collect due items first, then dispatch in one pass below
+            if to_send is None:
+                to_send = []
+            to_send.append((provider, pending.msg or "[KEEPALIVE] Continue your work."))
 
             # Clear pending (one keepalive per "Next:" declaration)
-            self.pending[provider] = None
+            pending_list[idx] = None
+            self._pending_mask &= ~bit
+
+        if to_send is None:
+            return sent_to
+
+        if send_batch_fn is not None:
+            try:
+                send_batch_fn(to_send)
+                sent_to.extend(provider for provider, _ in to_send)
+            except Exception as exc:
+                if on_error is not None:
+                    for provider, _ in to_send:
+                        on_error(provider, exc)
+        else:
+            for provider, msg in to_send:
+                try:
+                    send_fn(provider, msg)
+                    sent_to.append(provider)
+                except Exception as exc:
+                    if on_error is not None:
+                        on_error(provider, exc)
 
         return sent_to
 
     def cancel(self, provider: str) -> None:
         """Cancel pending keepalive for a provider."""
-        self.pending[provider] = None
+        idx = _PROVIDER_IDX.get(provider)
+        if idx is not None:
+            self.pending[idx] = None
+            self._pending_mask &= ~(1 << idx)
 
     def cancel_all(self) -> None:
         """Cancel all pending keepalives."""
-        self.pending.clear()
+        self.pending = [None] * len(_PROVIDER_NAMES)
+        self._pending_mask = 0
 
     def get_pending(self, provider: str) -> Optional[PendingKeepalive]:
         """Get pending keepalive for a provider (for debugging/testing)."""
-        return self.pending.get(provider)
+        idx = _PROVIDER_IDX.get(provider)
+        return self.pending[idx] if idx is not None else None
 
     def time_until_due(self, provider: str) -> Optional[float]:
         """Get seconds until keepalive is due for a provider.
@@ -175,10 +357,11 @@ class Keepalive:
             Seconds until due, or None if no pending keepalive.
             Negative value means overdue.
         """
-        pending = self.pending.get(provider)
+        idx = _PROVIDER_IDX.get(provider)
+        pending = self.pending[idx] if idx is not None else None
         if pending is None:
             return None
-        return pending.due - time.time()
+        return pending.due - self._clock()
 
 
 # Global instance for convenience
@@ -193,14 +376,19 @@ def get_keepalive() -> Keepalive:
     return _global_keepalive
 
 
-def on_ai_message(provider: str, message: str) -> None:
+def on_ai_message(provider: str, message: str, now: Optional[float] = None) -> None:
     """Convenience function to process AI message with global keepalive."""
-    get_keepalive().on_message(provider, message)
+    get_keepalive().on_message(provider, message, now=now)
 
 
 def tick_keepalive(
     send_fn: Callable[[str, str], None],
-    is_busy_fn: Optional[Callable[[str], bool]] = None
+    is_busy_fn: Optional[Callable[[str], bool]] = None,
+    now: Optional[float] = None,
+    on_error: Optional[Callable[[str, BaseException], None]] = None,
+    send_batch_fn: Optional[Callable[[List[tuple]], None]] = None,
 ) -> List[str]:
     """Convenience function to tick global keepalive."""
-    return get_keepalive().tick(send_fn, is_busy_fn)
+    return get_keepalive().tick(
+        send_fn, is_busy_fn, now=now, on_error=on_error, send_batch_fn=send_batch_fn
+    )
@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import atexit
 import getpass
+import hashlib
+import heapq
 import json
 import os
 import re
@@ -14,18 +16,67 @@ import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from constants import VERSION
 from i18n import t
-from path_utils import extract_session_work_dir_norm, normalize_path_for_match, work_dir_match_keys
+from path_utils import (
+    extract_session_work_dir_norm,
+    normalize_path_for_match,
+    versioned_work_dir_norm,
+    work_dir_match_keys,
+)
 from session_utils import check_session_writable, safe_write_session
 from terminal import Iterm2Backend, WeztermBackend, detect_terminal, get_shell_type
+from updater import _read_git_head
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# cwd candidates are stable for the life of the process; don't re-hash them
+# on every resume lookup.
+_SHA_CACHE: dict[str, str] = {}
+
+# Claude Code's filesystem-friendly project key: every non-alphanumeric
+# character becomes "-". Compiled once; _claude_project_dir runs it per
+# candidate on every resume.
+_PROJECT_KEY_RE = re.compile(r"[^A-Za-z0-9]")
+
+
+def _sha256_hex(value: str) -> str:
+    digest = _SHA_CACHE.get(value)
+    if digest is None:
+        digest = hashlib.sha256(value.encode()).hexdigest()
+        _SHA_CACHE[value] = digest
+    return digest
+
+
+def _read_git_head_info(script_dir: Path) -> str:
+    """
+    Resolve "<short-sha> <committer-date>" straight from .git via updater's
+    shared _read_git_head, avoiding a git fork on every `ccb up`. Returns ""
+    when the layout can't be read so the subprocess fallback runs.
+    """
+    head = _read_git_head(script_dir.parent / ".git")
+    if not head:
+        return ""
+    sha, committed = head
+    # Same shape as `git log -1 --format='%h %ci'`
+    return f"{sha[:7]} {committed.strftime('%Y-%m-%d %H:%M:%S %z')}"
 
 
 def _get_git_info(script_dir: Path) -> str:
+    info = _read_git_head_info(script_dir)
+    if info:
+        return info
     try:
         result = subprocess.run(
             ["git", "-C", str(script_dir), "log", "-1", "--format=%h %ci"],
@@ -67,6 +118,10 @@ class AILauncher:
         self.auto = auto
         self.no_claude = no_claude
         self.script_dir = Path(__file__).resolve().parent
+        # The launcher never chdirs, so cwd-derived strings can be computed once
+        self._cwd = Path.cwd()
+        self._cwd_str = str(self._cwd)
+        self._cwd_norm = normalize_path_for_match(self._cwd_str)
         self.session_id = f"ai-{int(time.time())}-{os.getpid()}"
         self.temp_base = Path(tempfile.gettempdir())
         self.runtime_dir = self.temp_base / f"claude-ai-{getpass.getuser()}" / self.session_id
@@ -76,6 +131,29 @@ class AILauncher:
         self.wezterm_panes = {}
         self.iterm2_panes = {}
         self.processes = {}
+        # Guards pane/process bookkeeping when providers start in parallel
+        self._panes_lock = threading.Lock()
+        # Backend objects are reused so any internal caches (CLI path lookup,
+        # shell detection) survive across calls
+        self._wezterm_backend = None
+        self._iterm2_backend = None
+        # History scans walk large session trees; memoize per (cwd, root) so
+        # repeated lookups during one run_up reuse the first result
+        self._history_scan_cache: dict[tuple, tuple] = {}
+
+    @staticmethod
+    def _now_str() -> str:
+        return time.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _wt(self) -> WeztermBackend:
+        if self._wezterm_backend is None:
+            self._wezterm_backend = WeztermBackend()
+        return self._wezterm_backend
+
+    def _it2(self) -> Iterm2Backend:
+        if self._iterm2_backend is None:
+            self._iterm2_backend = Iterm2Backend()
+        return self._iterm2_backend
 
     def _detect_terminal_type(self):
         # Forced by environment variable
@@ -93,6 +171,11 @@ class AILauncher:
         # Use detect_terminal() for auto-detection (WezTerm preferred)
         detected = detect_terminal()
         if detected:
+            # Export the decision so child processes (warmup pings, nested ccb
+            # commands, cask/gask in the panes) short-circuit at the forced
+            # check above instead of re-probing.
+            if not os.environ.get("CCB_TERMINAL"):
+                os.environ["CCB_TERMINAL"] = detected
             return detected
 
         # Fallback: if nothing found, return None for later handling
@@ -127,14 +210,14 @@ class AILauncher:
         if keep_open:
             start_cmd = _build_keep_open_cmd(provider, start_cmd)
 
-        backend = WeztermBackend()
+        backend = self._wt()
 
         # Check for new tab mode: first provider opens new tab, subsequent split in that tab
         new_tab_mode = os.environ.get("CCB_NEW_TAB", "").lower() in {"1", "true", "yes", "on"}
 
         if new_tab_mode and not self.wezterm_panes:
             # First provider: spawn new tab
-            pane_id = backend.spawn_new_tab(start_cmd, str(Path.cwd()))
+            pane_id = backend.spawn_new_tab(start_cmd, self._cwd_str)
             # Pre-calculate split direction for subsequent providers based on new tab dimensions
             # Pass the specific pane_id to get its dimensions
             self._first_split_direction = self._get_smart_split_direction(backend, target_pane_id=pane_id)
@@ -153,14 +236,13 @@ class AILauncher:
 
             parent_pane = None
             if self.wezterm_panes:
-                try:
-                    parent_pane = next(iter(self.wezterm_panes.values()))
-                except StopIteration:
-                    parent_pane = None
+                with self._panes_lock:
+                    parent_pane = next(iter(self.wezterm_panes.values()), None)
 
-            pane_id = backend.create_pane(start_cmd, str(Path.cwd()), direction=direction, percent=50, parent_pane=parent_pane)
+            pane_id = backend.create_pane(start_cmd, self._cwd_str, direction=direction, percent=50, parent_pane=parent_pane)
 
-        self.wezterm_panes[provider] = pane_id
+        with self._panes_lock:
+            self.wezterm_panes[provider] = pane_id
 
         if provider == "codex":
             self._write_codex_session(runtime, pane_id=pane_id)
@@ -183,6 +265,17 @@ class AILauncher:
             backend: WezTerm backend instance
             target_pane_id: Specific pane ID to check dimensions for (optional)
         """
+        # Fast path: when deciding for the pane we are running in, the TTY
+        # size is already known — no subprocess, no JSON parse of every pane.
+        # A terminal cell is roughly twice as tall as wide, so cols > 2*rows
+        # approximates the pixel_width >= pixel_height test below.
+        if target_pane_id is None and sys.stdout.isatty():
+            try:
+                size = shutil.get_terminal_size(fallback=(80, 24))
+                return "right" if size.columns > size.lines * 2 else "bottom"
+            except Exception:
+                pass
+
         try:
             # Get current pane info
             result = subprocess.run(
@@ -241,14 +334,13 @@ class AILauncher:
         direction = "right" if not self.iterm2_panes else "bottom"
         parent_pane = None
         if direction == "bottom":
-            try:
-                parent_pane = next(iter(self.iterm2_panes.values()))
-            except StopIteration:
-                parent_pane = None
+            with self._panes_lock:
+                parent_pane = next(iter(self.iterm2_panes.values()), None)
 
-        backend = Iterm2Backend()
-        pane_id = backend.create_pane(start_cmd, str(Path.cwd()), direction=direction, percent=50, parent_pane=parent_pane)
-        self.iterm2_panes[provider] = pane_id
+        backend = self._it2()
+        pane_id = backend.create_pane(start_cmd, self._cwd_str, direction=direction, percent=50, parent_pane=parent_pane)
+        with self._panes_lock:
+            self.iterm2_panes[provider] = pane_id
 
         if provider == "codex":
             self._write_codex_session(runtime, pane_id=pane_id)
@@ -281,10 +373,13 @@ class AILauncher:
         try:
             if not path.exists():
                 return {}
-            # Session files are written as UTF-8; on Windows PowerShell 5.1 the default encoding
-            # may not be UTF-8, so always decode explicitly and tolerate UTF-8 BOM.
-            raw = path.read_text(encoding="utf-8-sig")
-            data = json.loads(raw)
+            # Session files are written as UTF-8; on Windows PowerShell 5.1 the default
+            # encoding may not be UTF-8, so parse the raw bytes and strip a UTF-8 BOM
+            # ourselves — one decode pass instead of text-decode + json-parse.
+            raw = path.read_bytes()
+            if raw.startswith(b"\xef\xbb\xbf"):
+                raw = raw[3:]
+            data = _json_loads(raw)
             return data if isinstance(data, dict) else {}
         except Exception:
             return {}
@@ -296,7 +391,7 @@ class AILauncher:
             pass
 
     def _claude_session_file(self) -> Path:
-        return Path.cwd() / ".claude-session"
+        return self._cwd / ".claude-session"
 
     def _read_local_claude_session_id(self) -> str | None:
         data = self._read_json_file(self._claude_session_file())
@@ -307,7 +402,7 @@ class AILauncher:
             if not recorded_norm:
                 # Old/foreign session file without a recorded work dir: refuse to resume to avoid cross-project reuse.
                 return None
-            current_keys = work_dir_match_keys(Path.cwd())
+            current_keys = work_dir_match_keys(self._cwd)
             if current_keys and recorded_norm not in current_keys:
                 return None
             return sid.strip()
@@ -316,50 +411,157 @@ class AILauncher:
     def _write_local_claude_session(self, session_id: str, active: bool = True) -> None:
         path = self._claude_session_file()
         data = self._read_json_file(path)
-        work_dir = Path.cwd()
+        now = self._now_str()
         data.update(
             {
                 "claude_session_id": session_id,
-                "work_dir": str(work_dir),
-                "work_dir_norm": normalize_path_for_match(str(work_dir)),
+                "work_dir": self._cwd_str,
+                "work_dir_norm": self._cwd_norm,
+                "work_dir_norm_v2": versioned_work_dir_norm(self._cwd_norm),
                 "active": bool(active),
-                "started_at": data.get("started_at") or time.strftime("%Y-%m-%d %H:%M:%S"),
-                "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "started_at": data.get("started_at") or now,
+                "updated_at": now,
             }
         )
         self._write_json_file(path, data)
 
+    def _codex_index_path(self, root: Path) -> Path:
+        """Index next to the sessions tree mapping work_dir_norm -> last hit."""
+        return root.parent / "ccb-session-index.json"
+
+    @staticmethod
+    def _codex_tree_stamp(root: Path) -> float:
+        """Newest mtime across the sessions tree, stat-ing directories only.
+
+        Creating a session log bumps its parent directory's mtime, so the
+        max directory mtime is a cheap change detector for the whole tree
+        (a handful of year/month/day dirs instead of hundreds of logs).
+        """
+        newest = 0.0
+        stack = [str(root)]
+        while stack:
+            path = stack.pop()
+            try:
+                newest = max(newest, os.stat(path).st_mtime)
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return newest
+
     def _get_latest_codex_session_id(self) -> tuple[str | None, bool]:
         """
         Returns (session_id, has_any_history_for_cwd).
         Session id is Codex CLI's UUID used by `codex resume <id>`.
-        Always scans for the latest session to avoid resuming stale sessions.
+        A small on-disk index remembers the last hit per work dir; it is
+        trusted only while the recorded source log is unchanged AND nothing
+        newer has appeared anywhere in the tree (directory-mtime stamp), so
+        a freshly created session always triggers the full rescan and we
+        never resume a stale session. Falls back to a full scan otherwise.
         """
-        work_keys = work_dir_match_keys(Path.cwd())
+        work_keys = work_dir_match_keys(self._cwd)
         if not work_keys:
             return None, False
 
-        # Always scan Codex session logs for the latest session bound to this cwd.
-        # This ensures we always resume the most recent session, not a stale cached one.
         root = Path(os.environ.get("CODEX_SESSION_ROOT") or (Path.home() / ".codex" / "sessions")).expanduser()
         if not root.exists():
             return None, False
+
+        cache_key = ("codex", self._cwd_str, str(root))
+        cached_result = self._history_scan_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        index_path = self._codex_index_path(root)
+        index = self._read_json_file(index_path)
+        # Stamped before any scan so a log created mid-scan can only make
+        # the recorded stamp look stale, never mask a newer session.
+        tree_stamp = self._codex_tree_stamp(root)
+        for key in work_keys:
+            cached = index.get(key)
+            if not isinstance(cached, dict):
+                continue
+            source = cached.get("source_path")
+            cached_sid = cached.get("session_id")
+            if not (isinstance(source, str) and isinstance(cached_sid, str) and cached_sid):
+                continue
+            try:
+                if (
+                    Path(source).stat().st_mtime == cached.get("mtime")
+                    and tree_stamp <= float(cached.get("tree_stamp") or 0)
+                ):
+                    self._history_scan_cache[cache_key] = (cached_sid, True)
+                    return cached_sid, True
+            except (OSError, TypeError, ValueError):
+                continue
+        # Manual scandir walk: one cached stat per file (glob + sort-by-stat
+        # stats everything twice) and a linear-time top-K instead of sorting
+        # the whole tree.
         try:
-            logs = sorted(
-                (p for p in root.glob("**/*.jsonl") if p.is_file()),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
+            entries: list[tuple[float, str]] = []
+            stack = [str(root)]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    stack.append(entry.path)
+                                elif entry.name.endswith(".jsonl") and entry.is_file():
+                                    entries.append((entry.stat().st_mtime, entry.path))
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+            logs = [path for _, path in heapq.nlargest(400, entries)]
         except Exception:
             logs = []
-        for log_path in logs[:400]:
+        # Cheap byte-level filters: most logs are session_meta lines for some
+        # other work dir, so skip the JSON parse unless the raw line looks
+        # promising. Full normalized-cwd confirmation still happens below.
+        # Probe with the work dir's lowercased basename rather than the whole
+        # normalized key — the key reslashes/casefolds paths, so the full
+        # string may not appear verbatim in the recorded cwd.
+        meta_tags = (b'"type":"session_meta"', b'"type": "session_meta"')
+        cwd_probes: set[bytes] = set()
+        for key in work_keys:
+            tail = key.rsplit("/", 1)[-1]
+            if tail and tail.isascii():
+                cwd_probes.add(tail.encode("utf-8").lower())
+        for log_path in logs:
             try:
-                with log_path.open("r", encoding="utf-8", errors="ignore") as handle:
-                    first = handle.readline().strip()
+                # Only the first (session_meta) line matters; one raw os.read
+                # skips the BufferedReader/readline machinery per file. The
+                # meta line almost always fits in 4 KiB; keep reading in the
+                # rare case a long cwd pushes the newline past the first chunk.
+                fd = os.open(log_path, os.O_RDONLY)
+                try:
+                    first = os.read(fd, 4096)
+                    while b"\n" not in first:
+                        more = os.read(fd, 4096)
+                        if not more:
+                            break
+                        first += more
+                finally:
+                    os.close(fd)
             except OSError:
                 continue
             if not first:
                 continue
+            newline = first.find(b"\n")
+            if newline >= 0:
+                first = first[:newline]
+            if meta_tags[0] not in first and meta_tags[1] not in first:
+                continue
+            if cwd_probes:
+                lowered = first.lower()
+                if not any(probe in lowered for probe in cwd_probes):
+                    continue
             try:
                 entry = json.loads(first)
             except Exception:
@@ -374,7 +576,19 @@ class AILauncher:
                 continue
             sid = payload.get("id")
             if isinstance(sid, str) and sid:
+                try:
+                    index[normalize_path_for_match(cwd)] = {
+                        "session_id": sid,
+                        "source_path": log_path,
+                        "mtime": os.path.getmtime(log_path),
+                        "tree_stamp": tree_stamp,
+                    }
+                    safe_write_session(index_path, json.dumps(index, ensure_ascii=False, indent=2))
+                except Exception:
+                    pass
+                self._history_scan_cache[cache_key] = (sid, True)
                 return sid, True
+        self._history_scan_cache[cache_key] = (None, False)
         return None, False
 
     def _build_codex_start_cmd(self) -> str:
@@ -397,17 +611,20 @@ class AILauncher:
         Returns (project_hash, has_any_history_for_cwd).
         Gemini CLI stores sessions under ~/.gemini/tmp/<sha256(cwd)>/chats/.
         """
-        import hashlib
-
         gemini_root = Path(os.environ.get("GEMINI_ROOT") or (Path.home() / ".gemini" / "tmp")).expanduser()
 
+        cache_key = ("gemini", self._cwd_str, str(gemini_root))
+        cached_result = self._history_scan_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         candidates: list[str] = []
         try:
-            candidates.append(str(Path.cwd().absolute()))
+            candidates.append(str(self._cwd.absolute()))
         except Exception:
             pass
         try:
-            candidates.append(str(Path.cwd().resolve()))
+            candidates.append(str(self._cwd.resolve()))
         except Exception:
             pass
         env_pwd = (os.environ.get("PWD") or "").strip()
@@ -422,14 +639,16 @@ class AILauncher:
             if not candidate or candidate in seen:
                 continue
             seen.add(candidate)
-            project_hash = hashlib.sha256(candidate.encode()).hexdigest()
+            project_hash = _sha256_hex(candidate)
             chats_dir = gemini_root / project_hash / "chats"
             if not chats_dir.exists():
                 continue
             session_files = list(chats_dir.glob("session-*.json"))
             if session_files:
+                self._history_scan_cache[cache_key] = (project_hash, True)
                 return project_hash, True
 
+        self._history_scan_cache[cache_key] = (None, False)
         return None, False
 
     def _build_gemini_start_cmd(self) -> str:
@@ -457,32 +676,59 @@ class AILauncher:
 
         print(f"🔧 Warmup: {ping_script.name}")
         deadline = time.time() + timeout
-        last_result: subprocess.CompletedProcess[str] | None = None
+        last_output = ""
         sleep_s = 0.3
+        use_subprocess = False
         while time.time() < deadline:
-            last_result = subprocess.run(
-                [sys.executable, str(ping_script)],
-                cwd=str(Path.cwd()),
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-            )
-            if last_result.returncode == 0:
-                out = (last_result.stdout or "").strip()
+            # Ping in-process first: each subprocess attempt pays full Python
+            # cold start (~100ms), which dominates the retry loop.
+            if not use_subprocess:
+                try:
+                    rc, out = self._ping_in_process(provider)
+                except ImportError:
+                    use_subprocess = True
+                    continue
+            else:
+                result = subprocess.run(
+                    [sys.executable, str(ping_script)],
+                    cwd=self._cwd_str,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+                rc = result.returncode
+                out = ((result.stdout or "") + "\n" + (result.stderr or "")).strip()
+            if rc == 0:
                 if out:
                     print(out)
                 return True
+            last_output = out
             time.sleep(sleep_s)
             sleep_s = min(1.0, sleep_s * 1.5)
 
-        if last_result:
-            out = ((last_result.stdout or "") + "\n" + (last_result.stderr or "")).strip()
-            if out:
-                print(out)
+        if last_output:
+            print(last_output)
         print(f"⚠️ Warmup failed: {provider}")
         return False
 
+    @staticmethod
+    def _ping_in_process(provider: str) -> tuple[int, str]:
+        """Run a provider ping as a plain function call, no interpreter fork.
+
+        Raises ImportError when the communicator module is unavailable so the
+        caller can fall back to the subprocess ping script.
+        """
+        if provider == "codex":
+            from codex_comm import CodexCommunicator as comm_cls
+        else:
+            from gemini_comm import GeminiCommunicator as comm_cls
+        try:
+            healthy, message = comm_cls().ping(display=False)
+            return (0 if healthy else 1), message
+        except Exception as e:
+            return 1, f"❌ Connectivity test failed: {e}"
+
     def _get_start_cmd(self, provider: str) -> str:
         if provider == "codex":
             # NOTE: Codex TUI has paste-burst detection; terminal injection (wezterm send-text)
@@ -493,7 +739,7 @@ class AILauncher:
         return ""
 
     def _write_codex_session(self, runtime, pane_id=None):
-        session_file = Path.cwd() / ".codex-session"
+        session_file = self._cwd / ".codex-session"
 
         # Pre-check permissions
         writable, reason, fix = check_session_writable(session_file)
@@ -506,17 +752,17 @@ class AILauncher:
         if session_file.exists():
             data = self._read_json_file(session_file)
 
-        work_dir = Path.cwd()
         data.update(
             {
                 "session_id": self.session_id,
                 "runtime_dir": str(runtime),
                 "terminal": self.terminal_type,
                 "pane_id": pane_id,
-                "work_dir": str(work_dir),
-                "work_dir_norm": normalize_path_for_match(str(work_dir)),
+                "work_dir": self._cwd_str,
+                "work_dir_norm": self._cwd_norm,
+                "work_dir_norm_v2": versioned_work_dir_norm(self._cwd_norm),
                 "active": True,
-                "started_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "started_at": self._now_str(),
             }
         )
 
@@ -527,7 +773,7 @@ class AILauncher:
         return True
 
     def _write_gemini_session(self, runtime, pane_id=None):
-        session_file = Path.cwd() / ".gemini-session"
+        session_file = self._cwd / ".gemini-session"
 
         # Pre-check permissions
         writable, reason, fix = check_session_writable(session_file)
@@ -541,9 +787,9 @@ class AILauncher:
             "runtime_dir": str(runtime),
             "terminal": self.terminal_type,
             "pane_id": pane_id,
-            "work_dir": str(Path.cwd()),
+            "work_dir": self._cwd_str,
             "active": True,
-            "started_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "started_at": self._now_str(),
         }
 
         ok, err = safe_write_session(session_file, json.dumps(data, ensure_ascii=False, indent=2))
@@ -570,7 +816,7 @@ class AILauncher:
             pass
 
         for candidate in candidates:
-            key = re.sub(r"[^A-Za-z0-9]", "-", str(candidate))
+            key = _PROJECT_KEY_RE.sub("-", str(candidate))
             project_dir = projects_root / key
             if project_dir.exists():
                 return project_dir
@@ -580,7 +826,7 @@ class AILauncher:
             fallback_path = work_dir.resolve()
         except Exception:
             fallback_path = work_dir
-        key = re.sub(r"[^A-Za-z0-9]", "-", str(fallback_path))
+        key = _PROJECT_KEY_RE.sub("-", str(fallback_path))
         return projects_root / key
 
     def _get_latest_claude_session_id(self) -> tuple[str | None, bool]:
@@ -589,34 +835,46 @@ class AILauncher:
         - session_id: latest UUID-like session id if found (for `claude --resume <id>`).
         - has_any_history: whether this project has any Claude sessions on disk.
         """
-        project_dir = self._claude_project_dir(Path.cwd())
+        project_dir = self._claude_project_dir(self._cwd)
         if not project_dir.exists():
             return None, False
 
-        session_files = list(project_dir.glob("*.jsonl"))
-        if not session_files:
+        # scandir caches stat results on the DirEntry, so each candidate costs
+        # one stat instead of one for size and another for mtime.
+        try:
+            with os.scandir(project_dir) as it:
+                session_entries = [e for e in it if e.name.endswith(".jsonl") and e.is_file()]
+        except OSError:
+            return None, False
+        if not session_entries:
             return None, False
 
         session_env_root = Path.home() / ".claude" / "session-env"
+        # One directory listing replaces a per-file exists() syscall.
+        try:
+            env_stems = set(os.listdir(session_env_root))
+        except OSError:
+            env_stems = set()
 
-        uuid_sessions: list[Path] = []
-        for session_file in session_files:
+        uuid_sessions: list[os.DirEntry] = []
+        for entry in session_entries:
+            stem = entry.name[: -len(".jsonl")]
             try:
-                uuid.UUID(session_file.stem)
+                uuid.UUID(stem)
                 # Ignore zero-byte placeholders and sessions Claude cannot actually resume.
-                if session_file.stat().st_size <= 0:
+                if entry.stat().st_size <= 0:
                     continue
-                if not (session_env_root / session_file.stem).exists():
+                if stem not in env_stems:
                     continue
-                uuid_sessions.append(session_file)
+                uuid_sessions.append(entry)
             except Exception:
                 continue
 
         if not uuid_sessions:
             return None, True
 
-        latest = max(uuid_sessions, key=lambda p: p.stat().st_mtime)
-        return latest.stem, True
+        latest = max(uuid_sessions, key=lambda e: e.stat().st_mtime)
+        return latest.name[: -len(".jsonl")], True
 
     def _find_codex_cmd(self) -> str:
         """Find Codex CLI executable"""
@@ -761,31 +1019,44 @@ class AILauncher:
         self._cleaned = True
         print(f"\n🧹 {t('cleaning_up')}")
 
+        # Removing the runtime tree recurses through per-provider FIFOs/logs
+        # and can be slow (notably on Windows). Start it in the background and
+        # overlap it with the pane kills and session-file writes below.
+        rmtree_thread = None
+        if self.runtime_dir.exists():
+            rmtree_thread = threading.Thread(
+                target=shutil.rmtree, args=(str(self.runtime_dir),), kwargs={"ignore_errors": True}
+            )
+            rmtree_thread.start()
+
         if self.terminal_type == "wezterm":
-            backend = WeztermBackend()
+            backend = self._wt()
             for provider, pane_id in self.wezterm_panes.items():
                 if pane_id:
                     backend.kill_pane(pane_id)
         elif self.terminal_type == "iterm2":
-            backend = Iterm2Backend()
+            backend = self._it2()
             for provider, pane_id in self.iterm2_panes.items():
                 if pane_id:
                     backend.kill_pane(pane_id)
 
-        for session_file in [Path.cwd() / ".codex-session", Path.cwd() / ".gemini-session", Path.cwd() / ".claude-session"]:
+        ended_at = self._now_str()
+        for session_file in [self._cwd / ".codex-session", self._cwd / ".gemini-session", self._cwd / ".claude-session"]:
             if session_file.exists():
                 try:
                     data = self._read_json_file(session_file)
                     if not data:
                         continue
                     data["active"] = False
-                    data["ended_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+                    data["ended_at"] = ended_at
                     safe_write_session(session_file, json.dumps(data, ensure_ascii=False, indent=2))
                 except Exception:
                     pass
 
-        if self.runtime_dir.exists():
-            shutil.rmtree(self.runtime_dir, ignore_errors=True)
+        self._history_scan_cache.clear()
+
+        if rmtree_thread is not None:
+            rmtree_thread.join()
 
         print(f"✅ {t('cleanup_complete')}")
 
@@ -806,10 +1077,28 @@ class AILauncher:
         order = {"codex": 0, "gemini": 1}
         providers.sort(key=lambda p: order.get(p, 99))
 
-        for provider in providers:
-            if not self._start_provider(provider):
+        # The first provider must start synchronously: its pane is the split
+        # parent for the rest. Everything after that is independent I/O-bound
+        # work (pane RPCs + ping subprocesses), so overlap it in threads.
+        first, rest = providers[0], providers[1:]
+        if not self._start_provider(first):
+            return 1
+        if rest:
+            def _start_and_warm(provider: str) -> bool:
+                if not self._start_provider(provider):
+                    return False
+                self._warmup_provider(provider)
+                return True
+
+            with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+                first_warm = pool.submit(self._warmup_provider, first)
+                futures = [pool.submit(_start_and_warm, p) for p in rest]
+                started_ok = all(f.result() for f in futures)
+                first_warm.result()
+            if not started_ok:
                 return 1
-            self._warmup_provider(provider)
+        else:
+            self._warmup_provider(first)
 
         if self.no_claude:
             print(f"✅ {t('backends_started_no_claude')}")
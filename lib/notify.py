@@ -2,28 +2,47 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
+
+from output import is_tty
 
 
 def _is_macos() -> bool:
     return sys.platform == "darwin"
 
 
+# Resolve once: osascript never moves during a process lifetime and each
+# which() call rescans PATH.
+_OSASCRIPT_PATH = shutil.which("osascript") if _is_macos() else None
+
+# Each osascript spawn is expensive on macOS; coalesce notification bursts.
+_MIN_NOTIFY_INTERVAL = float(os.environ.get("CCB_NOTIFY_MIN_INTERVAL", "2.0"))
+_last_notify_ts = 0.0
+
+
 def send_notification(title: str, message: str) -> None:
     """Send a desktop notification (macOS only for now)."""
     if os.environ.get("CCB_NOTIFY", "1") not in ("1", "true", "yes"):
         return
 
-    if _is_macos() and shutil.which("osascript"):
+    if _OSASCRIPT_PATH:
+        global _last_notify_ts
+        now = time.monotonic()
+        if now - _last_notify_ts < _MIN_NOTIFY_INTERVAL:
+            return  # Drop bursts; the previous notification is still on screen
+        _last_notify_ts = now
+
         # Escape quotes for AppleScript
         safe_title = title.replace('"', '\"')
         safe_message = message.replace('"', '\"')
         # Truncate message if too long
         if len(safe_message) > 100:
             safe_message = safe_message[:97] + "..."
-        
+
         try:
             subprocess.run(
-                ["osascript", "-e", f'display notification "{safe_message}" with title "{safe_title}"'],
+                [_OSASCRIPT_PATH, "-e", f'display notification "{safe_message}" with title "{safe_title}"'],
                 capture_output=True,
                 check=False
             )
@@ -31,14 +50,45 @@ def send_notification(title: str, message: str) -> None:
             pass  # Fail silently for notifications
 
 
+# Title updates are debounced: notify helpers fire waiting/replied pairs in
+# quick succession and each write+flush can block on the terminal. Within the
+# window the latest title wins and a single write goes out.
+_TITLE_DEBOUNCE_SEC = 0.05
+_title_lock = threading.Lock()
+_pending_title = None
+_title_timer = None
+
+
+def _flush_title() -> None:
+    global _pending_title, _title_timer
+    with _title_lock:
+        title = _pending_title
+        _pending_title = None
+        _title_timer = None
+    if title is None:
+        return
+    try:
+        # ANSI escape sequence for setting window title
+        sys.stdout.write(f"\033]0;{title}\007")
+        sys.stdout.flush()
+    except Exception:
+        pass
+
+
 def set_terminal_title(title: str) -> None:
-    """Set the terminal window title."""
+    """Set the terminal window title (debounced)."""
     if os.environ.get("CCB_TITLE_UPDATE", "1") not in ("1", "true", "yes"):
         return
+    if not is_tty():
+        return  # Title sequences are noise in redirected logs
 
-    # ANSI escape sequence for setting window title
-    sys.stdout.write(f"\033]0;{title}\007")
-    sys.stdout.flush()
+    global _pending_title, _title_timer
+    with _title_lock:
+        _pending_title = title
+        if _title_timer is None:
+            # Non-daemon timer: short-lived CLI processes still flush on exit
+            _title_timer = threading.Timer(_TITLE_DEBOUNCE_SEC, _flush_title)
+            _title_timer.start()
 
 
 def notify_reply_received(provider: str, message: str) -> None:
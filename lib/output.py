@@ -4,23 +4,61 @@ Provides quiet mode, debug mode, JSON output formatting, and atomic file writes.
 Also provides TTY-aware output degradation for emoji and spinner characters.
 """
 
+import atexit
 import os
 import sys
 import json
 import tempfile
 import traceback
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional, Union
 
-# Global output state
-_quiet_mode = False
-_json_mode = False
-_debug_mode = False
-_output_data = {}
-_errors = []
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-# Emoji to text fallback mapping
-_EMOJI_FALLBACK = {
+@dataclass(slots=True)
+class OutputState:
+    """All output-mode state in one slotted object.
+
+    A single attribute read replaces the former set of module globals, and
+    holding it in a ContextVar keeps state per-task if ccb ever grows async.
+    """
+
+    quiet: bool = False
+    json: bool = False
+    debug: bool = False
+    data: dict = field(default_factory=dict)
+    errors: list = field(default_factory=list)
+    # isatty() is an ioctl; the answer never changes for a process, so ask once
+    tty: Optional[bool] = None
+
+
+_state: ContextVar[OutputState] = ContextVar("ccb_output_state", default=OutputState())
+
+# Env-derived defaults are snapshotted at import: init_output runs per command
+# and os.environ lookups plus truthy-string checks add up in long-lived hosts
+_CCB_QUIET_DEFAULT = False
+_CCB_DEBUG_DEFAULT = False
+
+
+def refresh_env():
+    """Re-read CCB_QUIET/CCB_DEBUG defaults (for tests that patch os.environ)."""
+    global _CCB_QUIET_DEFAULT, _CCB_DEBUG_DEFAULT
+    _CCB_QUIET_DEFAULT = os.environ.get("CCB_QUIET", "").lower() in ("1", "true", "yes")
+    _CCB_DEBUG_DEFAULT = os.environ.get("CCB_DEBUG", "").lower() in ("1", "true", "yes")
+
+
+refresh_env()
+
+# Emoji to text fallback mapping. Keys are interned so call-site literals
+# (interned by the compiler per module) hit the pointer-equality fast path in
+# the dict lookup instead of comparing multi-byte strings.
+_EMOJI_FALLBACK = {sys.intern(k): v for k, v in {
     "✅": "[OK]",
     "❌": "[ERROR]",
     "⚠️": "[WARN]",
@@ -35,7 +73,7 @@ _EMOJI_FALLBACK = {
     "🔄": "[SYNC]",
     "🔧": "[FIX]",
     "ℹ️": "[INFO]",
-}
+}.items()}
 
 # Spinner characters for TTY vs non-TTY
 _SPINNER_TTY = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
@@ -44,7 +82,15 @@ _SPINNER_PLAIN = "-\\|/"
 
 def is_tty() -> bool:
     """Check if stdout is a TTY (interactive terminal)."""
-    return sys.stdout.isatty() and not _json_mode
+    state = _state.get()
+    if state.tty is None:
+        state.tty = sys.stdout.isatty()
+    return state.tty and not state.json
+
+
+def reset_tty_cache():
+    """Forget the cached isatty() answer (for tests and stream redirection)."""
+    _state.get().tty = None
 
 
 def emoji(char: str, fallback: Optional[str] = None) -> str:
@@ -71,50 +117,62 @@ def spinner_chars() -> str:
 
 def init_output(quiet: bool = False, json_output: bool = False, debug: bool = False):
     """Initialize output settings from args or environment."""
-    global _quiet_mode, _json_mode, _debug_mode, _output_data, _errors
-    _quiet_mode = quiet or os.environ.get("CCB_QUIET", "").lower() in ("1", "true", "yes")
-    _json_mode = json_output
-    _debug_mode = debug or os.environ.get("CCB_DEBUG", "").lower() in ("1", "true", "yes")
-    _output_data = {}
-    _errors = []
+    debug_on = debug or _CCB_DEBUG_DEFAULT
+    _state.set(
+        OutputState(
+            quiet=quiet or _CCB_QUIET_DEFAULT,
+            json=json_output,
+            debug=debug_on,
+            tty=sys.stdout.isatty(),
+        )
+    )
+    global print_debug, print_debug_exception
+    print_debug = _print_debug if debug_on else _noop
+    print_debug_exception = _print_debug_exception if debug_on else _noop
 
 
 def is_quiet() -> bool:
     """Check if quiet mode is enabled."""
-    return _quiet_mode
+    return _state.get().quiet
 
 
 def is_json() -> bool:
     """Check if JSON output mode is enabled."""
-    return _json_mode
+    return _state.get().json
 
 
 def is_debug() -> bool:
     """Check if debug mode is enabled."""
-    return _debug_mode
+    return _state.get().debug
+
 
+def _noop(*args, **kwargs):
+    pass
 
-def print_debug(msg: str, *args):
+
+def _print_debug(msg: str, *args):
     """Print a debug message if debug mode is enabled."""
-    if not _debug_mode:
+    state = _state.get()
+    if not state.debug:
         return
-    if _json_mode:
-        if "debug_log" not in _output_data:
-            _output_data["debug_log"] = []
-        _output_data["debug_log"].append(msg if not args else f"{msg} {' '.join(str(a) for a in args)}")
+    if state.json:
+        if "debug_log" not in state.data:
+            state.data["debug_log"] = []
+        state.data["debug_log"].append(msg if not args else f"{msg} {' '.join(str(a) for a in args)}")
     else:
         formatted = f"[DEBUG] {msg}" if not args else f"[DEBUG] {msg} {' '.join(str(a) for a in args)}"
         print(formatted, file=sys.stderr)
 
 
-def print_debug_exception(e: Exception, context: str = ""):
+def _print_debug_exception(e: Exception, context: str = ""):
     """Print exception details in debug mode."""
-    if not _debug_mode:
+    state = _state.get()
+    if not state.debug:
         return
-    if _json_mode:
-        if "debug_log" not in _output_data:
-            _output_data["debug_log"] = []
-        _output_data["debug_log"].append({
+    if state.json:
+        if "debug_log" not in state.data:
+            state.data["debug_log"] = []
+        state.data["debug_log"].append({
             "context": context,
             "exception": str(e),
             "type": type(e).__name__,
@@ -125,47 +183,92 @@ def print_debug_exception(e: Exception, context: str = ""):
         traceback.print_exc(file=sys.stderr)
 
 
+# Rebound by init_output: in the dominant debug-off case the call sites hit a
+# bare no-op instead of re-checking state on every invocation. The default
+# bindings stay dynamic for callers that never run init_output.
+print_debug = _print_debug
+print_debug_exception = _print_debug_exception
+
+
 def print_msg(msg: str, force: bool = False):
     """Print a message unless in quiet mode."""
-    if _json_mode:
+    state = _state.get()
+    if state.json:
         return  # Suppress text output in JSON mode
-    if not _quiet_mode or force:
+    if not state.quiet or force:
         print(msg)
 
 
+# Batched stderr: when stderr is redirected (logs, pipes) each line-buffered
+# print is a syscall, so collect and flush once at exit. Interactive TTYs keep
+# immediate output.
+_deferred_errors: list = []
+_stderr_tty: Optional[bool] = None
+
+
+def _flush_deferred_errors():
+    if _deferred_errors:
+        try:
+            sys.stderr.write("\n".join(_deferred_errors) + "\n")
+            sys.stderr.flush()
+        except Exception:
+            pass
+        _deferred_errors.clear()
+
+
 def print_error(msg: str):
     """Print an error message (always shown, even in quiet mode)."""
-    if _json_mode:
-        _errors.append(msg)
-    else:
+    state = _state.get()
+    if state.json:
+        state.errors.append(msg)
+        return
+    global _stderr_tty
+    if _stderr_tty is None:
+        _stderr_tty = sys.stderr.isatty()
+    if _stderr_tty:
         print(msg, file=sys.stderr)
+        return
+    if not _deferred_errors:
+        atexit.register(_flush_deferred_errors)
+    _deferred_errors.append(msg)
 
 
 def set_output(key: str, value: Any):
     """Set a key-value pair for JSON output."""
-    _output_data[key] = value
+    _state.get().data[key] = value
 
 
 def add_to_list(key: str, value: Any):
     """Add a value to a list in the output data."""
-    if key not in _output_data:
-        _output_data[key] = []
-    _output_data[key].append(value)
+    data = _state.get().data
+    if key not in data:
+        data[key] = []
+    data[key].append(value)
 
 
 def get_output() -> dict:
     """Get the current output data."""
-    return _output_data.copy()
+    return _state.get().data.copy()
 
 
 def flush_json(exit_code: int = 0) -> int:
     """Print JSON output and return exit code."""
-    if _json_mode:
-        _output_data["success"] = exit_code == 0
-        _output_data["exit_code"] = exit_code
-        if _errors:
-            _output_data["errors"] = _errors
-        print(json.dumps(_output_data, ensure_ascii=False, indent=2))
+    state = _state.get()
+    if state.json:
+        state.data["success"] = exit_code == 0
+        state.data["exit_code"] = exit_code
+        if state.errors:
+            state.data["errors"] = state.errors
+        # Redirected stdout (StringIO, redirect_stdout, some harnesses) has
+        # no .buffer; fall back to a text write there
+        buffer = getattr(sys.stdout, "buffer", None) if HAS_ORJSON else None
+        if buffer is not None:
+            buffer.write(orjson.dumps(state.data, option=orjson.OPT_INDENT_2) + b"\n")
+            buffer.flush()
+        elif HAS_ORJSON:
+            print(orjson.dumps(state.data, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        else:
+            print(json.dumps(state.data, ensure_ascii=False, indent=2))
     return exit_code
 
 
@@ -183,24 +286,47 @@ def atomic_write(file_path: Union[str, Path], content: str, encoding: str = "utf
     Returns:
         True if successful, False otherwise
     """
-    target = Path(file_path)
-    target_dir = target.parent
+    return atomic_write_bytes(file_path, content.encode(encoding))
+
+
+def atomic_write_bytes(file_path: Union[str, Path], content: bytes) -> bool:
+    """Write raw bytes to file atomically using temp file + rename.
+
+    Bytes variant used by the JSON writers so pre-encoded payloads skip a
+    second encode pass inside the text layer.
+
+    Args:
+        file_path: Target file path
+        content: Bytes to write
+
+    Returns:
+        True if successful, False otherwise
+    """
+    # Plain string ops: this runs per session write and Path objects are
+    # allocation-heavy for a name/dirname split
+    target = os.fspath(file_path)
+    target_dir = os.path.dirname(target) or "."
 
     try:
         # Ensure parent directory exists
-        target_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(target_dir, exist_ok=True)
 
         # Write to temp file in same directory (for atomic rename)
         fd, tmp_path = tempfile.mkstemp(
             dir=target_dir,
-            prefix=f".{target.name}.",
+            prefix=f".{os.path.basename(target)}.",
             suffix=".tmp"
         )
         try:
-            with os.fdopen(fd, "w", encoding=encoding) as f:
-                f.write(content)
-                f.flush()
-                os.fsync(f.fileno())
+            # Raw fd writes: no BufferedWriter layer, one buffer copy less
+            view = memoryview(content)
+            try:
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
 
             # Atomic rename (works on POSIX, best-effort on Windows)
             os.replace(tmp_path, target)
@@ -213,24 +339,33 @@ def atomic_write(file_path: Union[str, Path], content: str, encoding: str = "utf
                 pass
             raise
     except Exception as e:
-        print_debug(f"atomic_write failed for {file_path}: {e}")
+        print_debug(f"atomic_write_bytes failed for {file_path}: {e}")
         return False
 
 
-def atomic_write_json(file_path: Union[str, Path], data: Any, indent: int = 2) -> bool:
+def atomic_write_json(file_path: Union[str, Path], data: Any, indent: int = 2, compact: bool = False) -> bool:
     """Write JSON data to file atomically.
 
     Args:
         file_path: Target file path
         data: Data to serialize as JSON
-        indent: JSON indentation (default: 2)
+        indent: JSON indentation (default: 2), ignored when compact is True
+        compact: Emit minimal separators and no indent — preferred for
+                 machine-read state files (20-30% smaller, faster to encode)
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        content = json.dumps(data, ensure_ascii=False, indent=indent)
-        return atomic_write(file_path, content)
+        if HAS_ORJSON:
+            option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            if compact or indent == 2:
+                return atomic_write_bytes(file_path, orjson.dumps(data, option=option))
+        if compact:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+        return atomic_write_bytes(file_path, payload)
     except (TypeError, ValueError) as e:
         print_debug(f"atomic_write_json serialization failed: {e}")
         return False
@@ -11,9 +11,38 @@ import subprocess
 import time
 from typing import Tuple, Optional
 
-# Strip ANSI escape sequences for content comparison
+from terminal import _get_wezterm_bin
+
+# Strip ANSI escape sequences for content comparison (reference pattern; the
+# hot path uses _strip_ansi below, a single-pass scanner with no backtracking)
 ANSI_RE = re.compile(r"\x1b\[.*?m|\x1b\[?[\d;]*[A-Za-z]")
 
+# CSI grammar, no backtracking: ESC [ <param/intermediate 0x20-0x3F>* <final
+# 0x40-0x7E>, plus two-character escapes like ESC c.
+_ANSI_SCAN_RE = re.compile(r"\x1b(?:\[[\x20-\x3f]*[\x40-\x7e]?|[A-Za-z])")
+
+
+def _strip_ansi(text: str) -> str:
+    """Remove ANSI escape sequences with a linear scan.
+
+    Early-outs when the buffer has no ESC at all (common for paste-heavy
+    panes); otherwise substitutes with a grammar-based pattern that never
+    backtracks, unlike the lazy ``.*?m`` in the reference ANSI_RE.
+    """
+    if "\x1b" not in text:
+        return text
+    return _ANSI_SCAN_RE.sub("", text)
+
+
+_ANSI_SCAN_RE_BYTES = re.compile(rb"\x1b(?:\[[\x20-\x3f]*[\x40-\x7e]?|[A-Za-z])")
+
+
+def _strip_ansi_bytes(data: bytes) -> bytes:
+    """Bytes twin of _strip_ansi for captures that never need decoding."""
+    if b"\x1b" not in data:
+        return data
+    return _ANSI_SCAN_RE_BYTES.sub(b"", data)
+
 
 def _env_float(name: str, default: float) -> float:
     """Get float from environment variable with default."""
@@ -23,6 +52,28 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
+# Overrides snapshotted at import; wait_for_idle runs per message and the
+# env lookup + float parse per call is avoidable
+_IDLE_QUIET_OVERRIDE: Optional[float] = None
+_IDLE_TIMEOUT_OVERRIDE: Optional[float] = None
+
+
+def refresh_env() -> None:
+    """Re-read CCB_IDLE_* overrides (for tests that patch os.environ)."""
+    global _IDLE_QUIET_OVERRIDE, _IDLE_TIMEOUT_OVERRIDE
+    try:
+        _IDLE_QUIET_OVERRIDE = float(os.environ["CCB_IDLE_QUIET_SEC"])
+    except (KeyError, TypeError, ValueError):
+        _IDLE_QUIET_OVERRIDE = None
+    try:
+        _IDLE_TIMEOUT_OVERRIDE = float(os.environ["CCB_IDLE_TIMEOUT"])
+    except (KeyError, TypeError, ValueError):
+        _IDLE_TIMEOUT_OVERRIDE = None
+
+
+refresh_env()
+
+
 class PaneIdleJudge:
     """Detect if a terminal pane is idle based on screen content stability.
 
@@ -37,24 +88,38 @@ class PaneIdleJudge:
             quiet_seconds: Screen must be stable for this many seconds to be considered idle.
                           Can be overridden by CCB_IDLE_QUIET_SEC environment variable.
         """
-        self.quiet_sec = _env_float("CCB_IDLE_QUIET_SEC", quiet_seconds)
-        self._last_snapshot = ""
+        self.quiet_sec = _IDLE_QUIET_OVERRIDE if _IDLE_QUIET_OVERRIDE is not None else quiet_seconds
+        # Prebuilt per pane: wezterm cli has no tail/stream mode so a spawn
+        # per poll is unavoidable, but the binary lookup and argv build are not
+        self._capture_argv: Optional[list] = None
+        self._capture_key: Optional[tuple] = None
+        # Only a hash is kept between polls: comparison is O(1) and the
+        # 500-line capture isn't retained across wait_for_idle iterations.
+        self._last_hash = hash("")
         self._last_change_ts = 0.0
 
-    def capture_pane_wezterm(self, pane_id: str, lines: int = 500) -> str:
-        """Capture pane content from WezTerm."""
+    def capture_pane_wezterm(self, pane_id: str, lines: int = 500) -> bytes:
+        """Capture pane content from WezTerm.
+
+        Returned as raw bytes: stability detection only hashes the buffer, so
+        decoding ~500 lines of UTF-8 per poll would be pure waste.
+        """
+        key = (pane_id, lines)
+        if self._capture_key != key:
+            wezterm_bin = _get_wezterm_bin() or "wezterm"
+            self._capture_argv = [wezterm_bin, "cli", "get-text", "--pane-id", pane_id, "--start-line", f"-{lines}"]
+            self._capture_key = key
         try:
             result = subprocess.run(
-                ["wezterm", "cli", "get-text", "--pane-id", pane_id, "--start-line", f"-{lines}"],
+                self._capture_argv,
                 capture_output=True,
-                text=True,
                 timeout=5.0,
             )
             if result.returncode == 0:
-                return ANSI_RE.sub("", result.stdout)
+                return _strip_ansi_bytes(result.stdout)
         except Exception:
             pass
-        return ""
+        return b""
 
     def capture_pane_iterm2(self, session_id: str, lines: int = 500) -> str:
         """Capture pane content from iTerm2 using AppleScript."""
@@ -85,8 +150,12 @@ class PaneIdleJudge:
             pass
         return ""
 
-    def capture_pane(self, pane_id: str, terminal: str = "wezterm", lines: int = 500) -> str:
-        """Capture pane content based on terminal type."""
+    def capture_pane(self, pane_id: str, terminal: str = "wezterm", lines: int = 500):
+        """Capture pane content based on terminal type.
+
+        WezTerm captures come back as bytes, iTerm2 (AppleScript) as text;
+        is_idle only hashes the result so both are fine.
+        """
         if terminal == "wezterm":
             return self.capture_pane_wezterm(pane_id, lines)
         elif terminal == "iterm2":
@@ -108,8 +177,9 @@ class PaneIdleJudge:
         text = self.capture_pane(pane_id, terminal)
         now = time.time()
 
-        if text != self._last_snapshot:
-            self._last_snapshot = text
+        snapshot_hash = hash(text)
+        if snapshot_hash != self._last_hash:
+            self._last_hash = snapshot_hash
             self._last_change_ts = now
 
         if now - self._last_change_ts >= self.quiet_sec:
@@ -136,7 +206,8 @@ class PaneIdleJudge:
         Returns:
             (became_idle, waited_seconds) - became_idle is True if pane became idle
         """
-        timeout = _env_float("CCB_IDLE_TIMEOUT", timeout)
+        if _IDLE_TIMEOUT_OVERRIDE is not None:
+            timeout = _IDLE_TIMEOUT_OVERRIDE
         t0 = time.time()
 
         while True:
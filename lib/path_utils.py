@@ -3,10 +3,16 @@ Path normalization utilities for cross-platform path matching.
 Handles Windows, WSL, and MSYS path variations.
 """
 
+import functools
 import os
 import re
 import posixpath
 from pathlib import Path
+from typing import Optional
+
+# Version of the normalization scheme; bump when normalize_path_for_match
+# changes observable output so stale pre-normalized session fields are ignored
+NORM_VERSION = 2
 
 # Regular expressions for path detection
 WIN_DRIVE_RE = re.compile(r"^[A-Za-z]:([/\\]|$)")
@@ -26,10 +32,16 @@ def looks_like_windows_path(value: str) -> bool:
     return False
 
 
-def normalize_path_for_match(value: str) -> str:
+def normalize_path_for_match(value: str, base: Optional[Path] = None) -> str:
     """
     Normalize a path-like string for loose matching across Windows/WSL/MSYS variations.
     This is used only for selecting a session for *current* cwd, so favor robustness.
+
+    Args:
+        value: Path-like string to normalize.
+        base: Directory used to absolutize relative inputs. Callers looping
+              over many candidates pass their own cwd so each call doesn't
+              re-stat it; defaults to Path.cwd().
     """
     s = (value or "").strip()
     if not s:
@@ -54,10 +66,20 @@ def normalize_path_for_match(value: str) -> str:
             or preview.startswith("\\\\")
         )
         if not is_abs:
-            s = str((Path.cwd() / Path(s)).absolute())
+            # String-level absolutize: no Path allocations on the hot matcher
+            s = os.path.join(str(base), s) if base is not None else os.path.abspath(s)
     except Exception:
         pass
 
+    # The string is absolute from here on, so the result is a pure function of
+    # (s, msys_like); memoize it — the same cwd/session strings are normalized
+    # over and over during session scans.
+    return _normalize_absolute(s, "MSYSTEM" in os.environ or os.name == "nt")
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_absolute(s: str, msys_like: bool) -> str:
+    """Tail of normalize_path_for_match for already-absolute strings."""
     s = s.replace("\\", "/")
 
     # Map WSL drive mount to Windows-style drive path for comparison.
@@ -69,7 +91,7 @@ def normalize_path_for_match(value: str) -> str:
     else:
         # Map MSYS /c/... to c:/... (Git-Bash/MSYS2 environments on Windows).
         m = MSYS_DRIVE_RE.match(s)
-        if m and ("MSYSTEM" in os.environ or os.name == "nt"):
+        if m and msys_like:
             drive = m.group(1).lower()
             rest = m.group(2)
             s = f"{drive}:/{rest}"
@@ -84,20 +106,21 @@ def normalize_path_for_match(value: str) -> str:
     else:
         s = posixpath.normpath(s)
 
-    # Normalize Windows drive letter casing (c:/..., not C:/...).
-    if WIN_DRIVE_RE.match(s):
+    # One drive-prefix match serves the casing fix and the Windows-likeness
+    # check below (the prefix survives the trailing-slash trim).
+    m_drive = WIN_DRIVE_RE.match(s)
+    if m_drive:
         s = s[0].lower() + s[1:]
 
     # Drop trailing slash (but keep "/" and "c:/").
     if len(s) > 1 and s.endswith("/"):
         s = s.rstrip("/")
-        if WIN_DRIVE_RE.match(s) and not s.endswith("/"):
+        if m_drive and len(s) == 2:
             # Ensure drive root keeps trailing slash form "c:/".
-            if len(s) == 2:
-                s = s + "/"
+            s = s + "/"
 
     # On Windows-like paths, compare case-insensitively to avoid drive letter/case issues.
-    if looks_like_windows_path(s):
+    if m_drive or s.startswith("//"):
         s = s.casefold()
 
     return s
@@ -117,17 +140,30 @@ def work_dir_match_keys(work_dir: Path) -> set[str]:
         candidates.append(str(work_dir.resolve()))
     except Exception:
         pass
+    cwd = Path.cwd()  # one getcwd for the whole candidate loop
     for candidate in candidates:
-        normalized = normalize_path_for_match(candidate)
+        normalized = normalize_path_for_match(candidate, base=cwd)
         if normalized:
             keys.add(normalized)
     return keys
 
 
+def versioned_work_dir_norm(norm: str) -> dict:
+    """Package an already-normalized work dir for storage in session files."""
+    return {"v": NORM_VERSION, "s": norm}
+
+
 def extract_session_work_dir_norm(session_data: dict) -> str:
     """Extract a normalized work dir marker from a session file payload."""
     if not isinstance(session_data, dict):
         return ""
+    # Fast path: sessions written by current ccb carry the normalized string
+    # with the normalizer version, so scans skip re-normalizing per file
+    v2 = session_data.get("work_dir_norm_v2")
+    if isinstance(v2, dict) and v2.get("v") == NORM_VERSION:
+        s = v2.get("s")
+        if isinstance(s, str) and s:
+            return s
     raw_norm = session_data.get("work_dir_norm")
     if isinstance(raw_norm, str) and raw_norm.strip():
         return normalize_path_for_match(raw_norm)
@@ -79,8 +79,18 @@ class SessionHealth:
         """
         self.session_file = Path(session_file)
         self.lock_file = self.session_file.with_suffix('.lock')
+        # String forms for hot paths: os.stat/os.open on a str skips the
+        # per-call Path fspath conversion
+        self._session_str = str(self.session_file)
+        self._lock_str = str(self.lock_file)
         self.lock_timeout = lock_timeout
         self._lock_fd = None
+        self._session_fd = None
+        self._last_touch_mono = 0.0
+        # Env tunables resolved once; is_stale/acquire_lock run per heartbeat
+        # tick and shouldn't re-parse the environment each time
+        self._skip_lock = _env_bool("CCB_SKIP_LOCK")
+        self._max_age = _env_float("CCB_SESSION_MAX_AGE", 86400.0)
 
     def acquire_lock(self) -> bool:
         """Acquire exclusive lock to prevent duplicate launches.
@@ -88,26 +98,50 @@ class SessionHealth:
         Returns:
             True if lock acquired successfully, False otherwise.
         """
-        if _env_bool("CCB_SKIP_LOCK"):
+        if self._skip_lock:
             return True
 
-        try:
-            self._lock_fd = open(self.lock_file, 'w')
+        if not HAS_FCNTL and HAS_MSVCRT:
+            return self._acquire_lock_msvcrt()
 
-            if HAS_FCNTL:
-                # Unix: use fcntl
-                fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-            elif HAS_MSVCRT:
-                # Windows: use msvcrt
-                import msvcrt
-                msvcrt.locking(self._lock_fd.fileno(), msvcrt.LK_NBLCK, 1)
-            else:
-                # No locking available, just use file existence
+        # The PID file itself is the lock: O_CREAT|O_EXCL is a single
+        # race-free syscall, so no flock round trip is needed
+        for attempt in (0, 1):
+            try:
+                fd = os.open(self._lock_str, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                is_held, _pid = self.is_locked()
+                if is_held or attempt:
+                    return False
+                # Stale lock from a dead process: clear it and retry once
+                try:
+                    os.unlink(self._lock_str)
+                except OSError:
+                    return False
+                continue
+            except OSError:
+                return False
+
+            try:
+                os.write(fd, str(os.getpid()).encode())
+            except OSError:
                 pass
+            self._lock_fd = fd
+            self._open_session_fd()
+            return True
+        return False
+
+    def _acquire_lock_msvcrt(self) -> bool:
+        """Windows fallback: advisory lock via msvcrt.locking."""
+        try:
+            self._lock_fd = open(self.lock_file, 'w')
+            import msvcrt
+            msvcrt.locking(self._lock_fd.fileno(), msvcrt.LK_NBLCK, 1)
 
             # Write PID to lock file
             self._lock_fd.write(str(os.getpid()))
             self._lock_fd.flush()
+            self._open_session_fd()
             return True
 
         except (IOError, OSError):
@@ -119,28 +153,43 @@ class SessionHealth:
                 self._lock_fd = None
             return False
 
+    def _open_session_fd(self) -> None:
+        """Keep a session fd open so heartbeats are a single utime syscall
+        instead of an open/close round trip per tick."""
+        try:
+            self._session_fd = os.open(self._session_str, os.O_WRONLY | os.O_CREAT, 0o644)
+        except OSError:
+            self._session_fd = None
+
     def release_lock(self) -> None:
         """Release the lock."""
-        if self._lock_fd:
+        if self._lock_fd is not None:
             try:
-                if HAS_FCNTL:
-                    fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_UN)
-                elif HAS_MSVCRT:
-                    import msvcrt
-                    try:
-                        msvcrt.locking(self._lock_fd.fileno(), msvcrt.LK_UNLCK, 1)
-                    except Exception:
-                        pass
-                self._lock_fd.close()
+                if isinstance(self._lock_fd, int):
+                    os.close(self._lock_fd)
+                else:
+                    if HAS_MSVCRT:
+                        import msvcrt
+                        try:
+                            msvcrt.locking(self._lock_fd.fileno(), msvcrt.LK_UNLCK, 1)
+                        except Exception:
+                            pass
+                    self._lock_fd.close()
             except Exception:
                 pass
             self._lock_fd = None
 
+        if self._session_fd is not None:
+            try:
+                os.close(self._session_fd)
+            except OSError:
+                pass
+            self._session_fd = None
+
         # Remove lock file
         try:
-            if self.lock_file.exists():
-                self.lock_file.unlink()
-        except Exception:
+            os.unlink(self._lock_str)
+        except OSError:
             pass
 
     def is_locked(self) -> Tuple[bool, Optional[int]]:
@@ -149,9 +198,23 @@ class SessionHealth:
         Returns:
             (is_locked, pid) - pid is the process ID holding the lock, or None.
         """
-        if not self.lock_file.exists():
+        # Fast path: the lock file records the owner PID, so one read plus a
+        # kill(0) probe answers liveness without the open+flock round trip
+        try:
+            pid_str = self.lock_file.read_text().strip()
+        except OSError:
             return False, None
-
+        except Exception:
+            return False, None
+        try:
+            pid = int(pid_str)
+        except ValueError:
+            # Legacy lock file without a PID: fall back to the lock probe
+            return self._is_locked_probe()
+        return self.is_process_alive(pid), pid
+
+    def _is_locked_probe(self) -> Tuple[bool, Optional[int]]:
+        """Advisory-lock probe for lock files that don't carry a PID."""
         # Try to acquire lock to test if it's held
         try:
             with open(self.lock_file, 'r+') as f:
@@ -194,6 +257,12 @@ class SessionHealth:
             # os.kill with signal 0 doesn't kill, just checks existence
             os.kill(pid, 0)
             return True
+        except ProcessLookupError:
+            # ESRCH: no such process
+            return False
+        except PermissionError:
+            # EPERM: process exists but belongs to another user — alive
+            return True
         except OSError:
             return False
         except Exception:
@@ -210,24 +279,33 @@ class SessionHealth:
             True if session is stale or doesn't exist.
         """
         if max_age_seconds is None:
-            max_age_seconds = _env_float("CCB_SESSION_MAX_AGE", 86400)
+            max_age_seconds = self._max_age
 
-        if not self.session_file.exists():
-            return True
+        # If this process just refreshed the heartbeat, the file is fresh by
+        # construction — answer without a stat syscall
+        if self._last_touch_mono and time.monotonic() - self._last_touch_mono < max_age_seconds * 0.5:
+            return False
 
         try:
-            mtime = self.session_file.stat().st_mtime
-            return time.time() - mtime > max_age_seconds
-        except Exception:
+            mtime = os.stat(self._session_str).st_mtime
+        except OSError:
             return True
+        return time.time() - mtime > max_age_seconds
 
     def update_heartbeat(self) -> None:
-        """Update heartbeat by touching the session file."""
-        if self.session_file.exists():
+        """Update heartbeat by bumping the session file mtime."""
+        if self._session_fd is not None:
             try:
-                self.session_file.touch()
-            except Exception:
+                os.utime(self._session_fd, None)
+                self._last_touch_mono = time.monotonic()
+                return
+            except OSError:
                 pass
+        try:
+            self.session_file.touch()
+            self._last_touch_mono = time.monotonic()
+        except Exception:
+            pass
 
     def cleanup_stale(self) -> bool:
         """Clean up stale session and lock files.
@@ -243,38 +321,55 @@ class SessionHealth:
             if not self.is_process_alive(pid):
                 # Process is dead, clean up lock
                 try:
-                    self.lock_file.unlink()
+                    os.unlink(self._lock_str)
                     cleaned = True
-                except Exception:
+                except OSError:
                     pass
 
         # Check if session file is stale
         if self.is_stale():
             try:
-                if self.session_file.exists():
-                    self.session_file.unlink()
-                    cleaned = True
-            except Exception:
+                os.unlink(self._session_str)
+                cleaned = True
+            except OSError:
                 pass
 
         return cleaned
 
+    def _stat_both(self):
+        """One os.stat each for the session and lock files (None if missing)."""
+        try:
+            sess = os.stat(self._session_str)
+        except OSError:
+            sess = None
+        try:
+            lock = os.stat(self._lock_str)
+        except OSError:
+            lock = None
+        return sess, lock
+
     def get_status(self) -> dict:
         """Get comprehensive health status.
 
         Returns:
             Dictionary with health information.
         """
-        is_locked, pid = self.is_locked()
+        # Two stats feed every field below; the previous version re-statted
+        # the same files through exists()/is_stale()/is_locked() separately
+        sess, lock = self._stat_both()
+        if lock is not None:
+            is_locked, pid = self.is_locked()
+        else:
+            is_locked, pid = False, None
         process_alive = self.is_process_alive(pid) if pid else False
 
         return {
-            "session_exists": self.session_file.exists(),
-            "lock_exists": self.lock_file.exists(),
+            "session_exists": sess is not None,
+            "lock_exists": lock is not None,
             "is_locked": is_locked,
             "lock_pid": pid,
             "process_alive": process_alive,
-            "is_stale": self.is_stale(),
+            "is_stale": sess is None or time.time() - sess.st_mtime > self._max_age,
             "session_file": str(self.session_file),
             "lock_file": str(self.lock_file),
         }
@@ -321,16 +416,13 @@ def with_session_lock(session_file: Path):
         def wrapper(*args, **kwargs):
             health = SessionHealth(session_file)
 
-            # Check for existing lock
-            is_locked, pid = health.is_locked()
-            if is_locked:
-                if health.is_process_alive(pid):
-                    raise RuntimeError(f"Another instance (PID {pid}) is running")
-                else:
-                    health.cleanup_stale()
-
-            # Acquire lock
+            # acquire_lock clears dead-owner locks inline, so a single call
+            # replaces the old is_locked + cleanup_stale preamble; it only
+            # fails when a live owner holds the lock
             if not health.acquire_lock():
+                _, pid = health.is_locked()
+                if pid:
+                    raise RuntimeError(f"Another instance (PID {pid}) is running")
                 raise RuntimeError("Failed to acquire session lock")
 
             try:
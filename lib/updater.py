@@ -2,32 +2,137 @@
 Version checking and update utilities for ccb.
 """
 
+import functools
 import json
 import os
 import platform
+import re
 import shutil
 import subprocess
+import sys
 import tarfile
 import tempfile
 import time
+from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 from constants import VERSION
 
+# Matches the VERSION / GIT_COMMIT / GIT_DATE assignments in lib/constants.py
+# that install.sh stamps into installed copies, in one multiline scan
+_VER_RE = re.compile(r'^(VERSION|GIT_COMMIT|GIT_DATE)\s*=\s*["\']?([^"\'\n]*)', re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context():
+    """Shared verified SSL context.
+
+    ssl.create_default_context() re-reads the CA bundle from disk each
+    time; one context serves every HTTPS call in the process.
+    """
+    import ssl
+    return ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=None)
+def _git_available(dir_path: str) -> bool:
+    """Whether git is on PATH and dir_path is a git checkout.
+
+    shutil.which walks every PATH entry; caching per directory keeps
+    repeated version polls from re-probing the filesystem.
+    """
+    return bool(shutil.which("git")) and Path(dir_path, ".git").exists()
+
+
+def _read_git_head(git_dir: Path) -> tuple[str, datetime] | None:
+    """Resolve HEAD to (sha, committer datetime) by reading .git directly.
+
+    Spawning git costs a fork+exec per call; HEAD, its ref and the loose
+    commit object are three small file reads. The datetime carries the
+    committer's own UTC offset, so strftime with %z reproduces git's %ci
+    formatting. Returns None when anything is packed or unparseable so
+    callers can fall back to subprocess git. Shared with the launcher
+    banner (launcher._read_git_head_info).
+    """
+    import zlib
+
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8", errors="replace").strip()
+        if head.startswith("ref: "):
+            ref = head[5:].strip()
+            ref_path = git_dir / ref
+            if ref_path.is_file():
+                sha = ref_path.read_text(encoding="utf-8").strip()
+            else:
+                sha = None
+                packed = git_dir / "packed-refs"
+                if packed.is_file():
+                    for line in packed.read_text(encoding="utf-8", errors="replace").splitlines():
+                        if line.endswith(" " + ref):
+                            sha = line.split()[0]
+                            break
+                if not sha:
+                    return None
+        else:
+            sha = head
+        if len(sha) < 40:
+            return None
+
+        obj_path = git_dir / "objects" / sha[:2] / sha[2:]
+        if not obj_path.is_file():
+            return None
+        data = zlib.decompress(obj_path.read_bytes())
+        for line in data.split(b"\n"):
+            if not line:
+                break
+            if line.startswith(b"committer "):
+                # "committer Name <email> <epoch> <tz>"
+                _, epoch_s, tz_b = line.rsplit(b" ", 2)
+                tz = tz_b.decode("ascii")
+                offset = timedelta(
+                    hours=int(tz[:3]), minutes=int(tz[:1] + tz[3:])
+                )
+                return sha, datetime.fromtimestamp(int(epoch_s), timezone(offset))
+        return None
+    except Exception:
+        return None
+
 
 def get_version_info(dir_path: Path) -> dict:
     """Get commit hash, date and version from install directory"""
     info = {"commit": None, "date": None, "version": VERSION}
-    if shutil.which("git") and (dir_path / ".git").exists():
-        result = subprocess.run(
-            ["git", "-C", str(dir_path), "log", "-1", "--format=%h|%ci"],
-            capture_output=True, text=True, encoding='utf-8', errors='replace'
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            parts = result.stdout.strip().split("|")
-            if len(parts) >= 2:
-                info["commit"] = parts[0]
-                info["date"] = parts[1].split()[0]
+
+    # Fast path: installed copies carry stamped GIT_COMMIT/GIT_DATE in
+    # lib/constants.py; one bounded read beats spawning a git subprocess
+    try:
+        with open(dir_path / "lib" / "constants.py", "r", encoding="utf-8", errors="replace") as f:
+            head = f.read(4096)
+        stamped = {m.group(1): m.group(2).strip() for m in _VER_RE.finditer(head)}
+        if stamped.get("GIT_COMMIT"):
+            info["commit"] = stamped["GIT_COMMIT"]
+            info["date"] = stamped.get("GIT_DATE") or None
+            return info
+    except OSError:
+        pass
+
+    git_dir = dir_path / ".git"
+    if git_dir.exists():
+        head_info = _read_git_head(git_dir)
+        if head_info:
+            sha, committed = head_info
+            info["commit"] = sha[:7]
+            info["date"] = committed.strftime("%Y-%m-%d")
+            return info
+        if _git_available(str(dir_path)):
+            result = subprocess.run(
+                ["git", "-C", str(dir_path), "log", "-1", "--format=%h|%ci"],
+                capture_output=True, text=True, encoding='utf-8', errors='replace'
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                parts = result.stdout.strip().split("|")
+                if len(parts) >= 2:
+                    info["commit"] = parts[0]
+                    info["date"] = parts[1].split()[0]
     return info
 
 
@@ -43,21 +148,69 @@ def format_version_info(info: dict) -> str:
     return " ".join(parts) if parts else "unknown"
 
 
+# Remote version probes are cached on disk for this long (seconds)
+_REMOTE_CACHE_TTL = 600.0
+
+
+def _remote_cache_path() -> Path:
+    return Path.home() / ".cache" / "ccb" / "remote_version.json"
+
+
+def _write_remote_cache(cache: Path, payload: dict) -> None:
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(json.dumps(payload), encoding="utf-8")
+    except Exception:
+        pass
+
+
 def get_remote_version_info() -> dict | None:
     """Get latest version info from GitHub API"""
     import urllib.request
-    import ssl
+    import urllib.error
 
     api_url = "https://api.github.com/repos/gitmzc/claude_code_bridge/commits/main"
+
+    # Each probe is a synchronous HTTPS round trip; a short on-disk TTL
+    # cache lets repeated invocations across subcommands skip it entirely
+    cache = _remote_cache_path()
+    cached = None
+    try:
+        st = cache.stat()
+        cached = json.loads(cache.read_text(encoding="utf-8"))
+        if not (isinstance(cached, dict) and cached.get("commit")):
+            cached = None
+        elif time.time() - st.st_mtime < _REMOTE_CACHE_TTL:
+            return {"commit": cached["commit"], "date": cached.get("date")}
+    except Exception:
+        cached = None
+
+    headers = {"User-Agent": "ccb", "Accept-Encoding": "gzip"}
+    if cached and cached.get("etag"):
+        # Conditional request: a 304 answer carries no body at all
+        headers["If-None-Match"] = cached["etag"]
+
     try:
-        ctx = ssl.create_default_context()
-        req = urllib.request.Request(api_url, headers={"User-Agent": "ccb"})
-        with urllib.request.urlopen(req, context=ctx, timeout=5) as resp:
-            data = json.loads(resp.read().decode('utf-8'))
+        req = urllib.request.Request(api_url, headers=headers)
+        with urllib.request.urlopen(req, context=_ssl_context(), timeout=5) as resp:
+            body = resp.read()
+            if resp.headers.get("Content-Encoding") == "gzip":
+                import gzip
+                body = gzip.decompress(body)
+            data = json.loads(body.decode('utf-8'))
+            etag = resp.headers.get("ETag")
             commit = data.get("sha", "")[:7]
             date_str = data.get("commit", {}).get("committer", {}).get("date", "")
             date = date_str[:10] if date_str else None
+            _write_remote_cache(cache, {"commit": commit, "date": date, "etag": etag})
             return {"commit": commit, "date": date}
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            try:
+                cache.touch()
+            except OSError:
+                pass
+            return {"commit": cached["commit"], "date": cached.get("date")}
     except Exception:
         pass
 
@@ -72,6 +225,7 @@ def get_remote_version_info() -> dict | None:
                 commit = data.get("sha", "")[:7]
                 date_str = data.get("commit", {}).get("committer", {}).get("date", "")
                 date = date_str[:10] if date_str else None
+                _write_remote_cache(cache, {"commit": commit, "date": date})
                 return {"commit": commit, "date": date}
             except Exception:
                 pass
@@ -83,7 +237,7 @@ def update_from_git(install_dir: Path) -> tuple[bool, str]:
     Update via git pull.
     Returns (success, message).
     """
-    if not shutil.which("git") or not (install_dir / ".git").exists():
+    if not _git_available(str(install_dir)):
         return False, "Git not available or not a git repository"
 
     result = subprocess.run(
@@ -118,9 +272,22 @@ def pick_temp_base_dir(install_dir: Path) -> Path:
         ]
     )
 
+    # TMPDIR and tempfile.gettempdir() usually resolve to the same place;
+    # collapse duplicates so each distinct directory is probed once
+    unique: dict[Path, None] = {}
     for base in candidates:
+        try:
+            unique[base.expanduser().resolve(strict=False)] = None
+        except Exception:
+            continue
+
+    for base in unique:
         try:
             base.mkdir(parents=True, exist_ok=True)
+            # Cheap permission check first; only a surviving candidate pays
+            # for the real write probe
+            if not os.access(base, os.W_OK):
+                continue
             probe = base / f".ccb_tmp_probe_{os.getpid()}_{int(time.time() * 1000)}"
             probe.write_bytes(b"1")
             probe.unlink(missing_ok=True)
@@ -136,11 +303,45 @@ def pick_temp_base_dir(install_dir: Path) -> Path:
     )
 
 
+# The 'data' extraction filter (3.12+) rejects traversal, absolute paths
+# and dangerous member types itself, making the manual prepass redundant
+_HAS_DATA_FILTER = sys.version_info >= (3, 12)
+
+
+def _safe_extract(tar: tarfile.TarFile, dest: Path) -> None:
+    """Extract a seekable tarball after validating member paths."""
+    dest = dest.resolve()
+    if _HAS_DATA_FILTER:
+        tar.extractall(dest, filter='data')
+        return
+    dest_prefix = str(dest) + os.sep
+    for member in tar.getmembers():
+        member_path = (dest / member.name).resolve()
+        if not str(member_path).startswith(dest_prefix):
+            raise RuntimeError(f"Unsafe tar member path: {member.name}")
+    tar.extractall(dest)
+
+
+def _safe_extract_stream(tar: tarfile.TarFile, dest: Path) -> None:
+    """Extract a non-seekable (streaming) tarball, validating as we go."""
+    dest = dest.resolve()
+    dest_prefix = str(dest) + os.sep
+    for member in tar:
+        member_path = (dest / member.name).resolve()
+        if not str(member_path).startswith(dest_prefix):
+            raise RuntimeError(f"Unsafe tar member path: {member.name}")
+        try:
+            tar.extract(member, dest, filter='data')
+        except TypeError:
+            tar.extract(member, dest)
+
+
 def update_from_tarball(install_dir: Path, repo_url: str = "https://github.com/gitmzc/claude_code_bridge") -> tuple[bool, str]:
     """
     Update by downloading tarball.
     Returns (success, message).
     """
+    import ssl
     import urllib.request
 
     tarball_url = f"{repo_url}/archive/refs/heads/main.tar.gz"
@@ -154,53 +355,50 @@ def update_from_tarball(install_dir: Path, repo_url: str = "https://github.com/g
         if tmp_dir.exists():
             shutil.rmtree(tmp_dir)
         tmp_dir.mkdir(parents=True, exist_ok=True)
-        tarball_path = tmp_dir / "main.tar.gz"
 
-        # Prefer curl/wget (better certificate handling)
-        downloaded = False
-        if shutil.which("curl"):
-            result = subprocess.run(
-                ["curl", "-fsSL", "-o", str(tarball_path), tarball_url],
-                capture_output=True
-            )
-            downloaded = result.returncode == 0
-        if not downloaded and shutil.which("wget"):
-            result = subprocess.run(
-                ["wget", "-q", "-O", str(tarball_path), tarball_url],
-                capture_output=True
-            )
-            downloaded = result.returncode == 0
-        if not downloaded:
-            # Fallback to urllib (may have SSL issues)
-            import ssl
-            try:
-                urllib.request.urlretrieve(tarball_url, tarball_path)
-            except ssl.SSLError:
+        # Stream the response straight into the extractor: the tarball never
+        # touches disk and gunzip overlaps with the network read
+        extracted = False
+        try:
+            req = urllib.request.Request(tarball_url, headers={"User-Agent": "ccb"})
+            with urllib.request.urlopen(req, context=_ssl_context(), timeout=30) as resp:
+                with tarfile.open(fileobj=resp, mode="r|gz") as tar:
+                    _safe_extract_stream(tar, tmp_dir)
+            extracted = True
+        except Exception:
+            pass
+
+        if not extracted:
+            # Fallback: curl/wget handle certificates better on some systems
+            tarball_path = tmp_dir / "main.tar.gz"
+            downloaded = False
+            if shutil.which("curl"):
+                result = subprocess.run(
+                    ["curl", "-fsSL", "-o", str(tarball_path), tarball_url],
+                    capture_output=True
+                )
+                downloaded = result.returncode == 0
+            if not downloaded and shutil.which("wget"):
+                result = subprocess.run(
+                    ["wget", "-q", "-O", str(tarball_path), tarball_url],
+                    capture_output=True
+                )
+                downloaded = result.returncode == 0
+            if not downloaded:
+                # Last resort without certificate verification
                 ctx = ssl.create_default_context()
                 ctx.check_hostname = False
                 ctx.verify_mode = ssl.CERT_NONE
-                with urllib.request.urlopen(tarball_url, context=ctx) as resp:
-                    tarball_path.write_bytes(resp.read())
-
-        def _safe_extract(tar: tarfile.TarFile, dest: Path) -> None:
-            dest = dest.resolve()
-            for member in tar.getmembers():
-                member_path = (dest / member.name).resolve()
-                if not str(member_path).startswith(str(dest) + os.sep):
-                    raise RuntimeError(f"Unsafe tar member path: {member.name}")
-            # Python 3.14+ requires filter argument
-            try:
-                tar.extractall(dest, filter='data')
-            except TypeError:
-                tar.extractall(dest)
-
-        with tarfile.open(tarball_path, "r:gz") as tar:
-            _safe_extract(tar, tmp_dir)
+                with urllib.request.urlopen(tarball_url, context=ctx, timeout=30) as resp:
+                    with tarfile.open(fileobj=resp, mode="r|gz") as tar:
+                        _safe_extract_stream(tar, tmp_dir)
+            else:
+                with tarfile.open(tarball_path, "r:gz") as tar:
+                    _safe_extract(tar, tmp_dir)
 
         extracted_dir = tmp_dir / "claude_code_bridge-main"
 
-        env = os.environ.copy()
-        env["CODEX_INSTALL_PREFIX"] = str(install_dir)
+        env = {**os.environ, "CODEX_INSTALL_PREFIX": str(install_dir)}
         # Windows: use install.ps1, Unix: use install.sh
         if platform.system() == "Windows":
             ps1_script = extracted_dir / "install.ps1"
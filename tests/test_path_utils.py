@@ -24,50 +24,54 @@ from path_utils import (
 class TestLooksLikeWindowsPath(unittest.TestCase):
     """Tests for looks_like_windows_path function."""
 
-    def test_windows_drive_path(self):
-        """Windows drive paths should be detected."""
-        self.assertTrue(looks_like_windows_path("C:\\Users\\test"))
-        self.assertTrue(looks_like_windows_path("D:/Projects/foo"))
-        self.assertTrue(looks_like_windows_path("c:\\"))
-        self.assertTrue(looks_like_windows_path("C:"))
-
-    def test_unc_path(self):
-        """UNC paths should be detected as Windows paths."""
-        self.assertTrue(looks_like_windows_path("\\\\server\\share"))
-        self.assertTrue(looks_like_windows_path("//server/share"))
-
-    def test_unix_path(self):
-        """Unix paths should not be detected as Windows paths."""
-        self.assertFalse(looks_like_windows_path("/home/user"))
-        self.assertFalse(looks_like_windows_path("/mnt/c/Users"))
-        self.assertFalse(looks_like_windows_path("/c/Users"))
-
-    def test_empty_and_whitespace(self):
-        """Empty and whitespace strings should return False."""
-        self.assertFalse(looks_like_windows_path(""))
-        self.assertFalse(looks_like_windows_path("   "))
+    WINDOWS_PATHS = (
+        "C:\\Users\\test",
+        "D:/Projects/foo",
+        "c:\\",
+        "C:",
+        "\\\\server\\share",
+        "//server/share",
+    )
+    NON_WINDOWS_PATHS = (
+        "/home/user",
+        "/mnt/c/Users",
+        "/c/Users",
+        "",
+        "   ",
+    )
+
+    def test_windows_paths_detected(self):
+        """Windows drive and UNC paths should be detected."""
+        for path in self.WINDOWS_PATHS:
+            with self.subTest(path=path):
+                self.assertTrue(looks_like_windows_path(path))
+
+    def test_non_windows_paths_rejected(self):
+        """Unix, empty and whitespace strings should return False."""
+        for path in self.NON_WINDOWS_PATHS:
+            with self.subTest(path=path):
+                self.assertFalse(looks_like_windows_path(path))
 
 
 class TestNormalizePathForMatch(unittest.TestCase):
     """Tests for normalize_path_for_match function."""
 
+    EMPTY_INPUTS = ("", None, "   ")
+    WINDOWS_LIKE_PATHS = ("C:\\Users\\test", "/mnt/c/Users/test")
+
     def test_empty_input(self):
         """Empty input should return empty string."""
-        self.assertEqual(normalize_path_for_match(""), "")
-        self.assertEqual(normalize_path_for_match(None), "")
-        self.assertEqual(normalize_path_for_match("   "), "")
-
-    def test_windows_path_normalization(self):
-        """Windows paths should be normalized with lowercase drive letter."""
-        result = normalize_path_for_match("C:\\Users\\test")
-        self.assertTrue(result.startswith("c:"))
-        self.assertIn("users", result)  # case-folded
-
-    def test_wsl_path_to_windows(self):
-        """WSL /mnt/c/... paths should map to c:/..."""
-        result = normalize_path_for_match("/mnt/c/Users/test")
-        self.assertTrue(result.startswith("c:"))
-        self.assertIn("users", result)
+        for value in self.EMPTY_INPUTS:
+            with self.subTest(value=value):
+                self.assertEqual(normalize_path_for_match(value), "")
+
+    def test_windows_like_normalization(self):
+        """Windows and WSL paths should normalize to a lowercase c: form."""
+        for path in self.WINDOWS_LIKE_PATHS:
+            with self.subTest(path=path):
+                result = normalize_path_for_match(path)
+                self.assertTrue(result.startswith("c:"))
+                self.assertIn("users", result)  # case-folded
 
     def test_wsl_and_windows_match(self):
         """WSL and Windows paths to same location should normalize identically."""
@@ -142,9 +146,9 @@ class TestExtractSessionWorkDirNorm(unittest.TestCase):
 
     def test_non_dict(self):
         """Non-dict input should return empty string."""
-        self.assertEqual(extract_session_work_dir_norm(None), "")
-        self.assertEqual(extract_session_work_dir_norm([]), "")
-        self.assertEqual(extract_session_work_dir_norm("string"), "")
+        for value in (None, [], "string"):
+            with self.subTest(value=value):
+                self.assertEqual(extract_session_work_dir_norm(value), "")
 
     def test_work_dir_norm_preferred(self):
         """work_dir_norm should be preferred over work_dir."""
@@ -174,17 +178,20 @@ class TestExtractSessionWorkDirNorm(unittest.TestCase):
 class TestWinDriveRegex(unittest.TestCase):
     """Tests for WIN_DRIVE_RE regex."""
 
+    DRIVE_PATHS = ("C:", "C:/", "C:\\", "d:/path")
+    UNIX_PATHS = ("/home", "/c/Users")
+
     def test_matches_drive_letter(self):
         """Should match drive letter patterns."""
-        self.assertIsNotNone(WIN_DRIVE_RE.match("C:"))
-        self.assertIsNotNone(WIN_DRIVE_RE.match("C:/"))
-        self.assertIsNotNone(WIN_DRIVE_RE.match("C:\\"))
-        self.assertIsNotNone(WIN_DRIVE_RE.match("d:/path"))
+        for path in self.DRIVE_PATHS:
+            with self.subTest(path=path):
+                self.assertIsNotNone(WIN_DRIVE_RE.match(path))
 
     def test_no_match_unix(self):
         """Should not match Unix paths."""
-        self.assertIsNone(WIN_DRIVE_RE.match("/home"))
-        self.assertIsNone(WIN_DRIVE_RE.match("/c/Users"))
+        for path in self.UNIX_PATHS:
+            with self.subTest(path=path):
+                self.assertIsNone(WIN_DRIVE_RE.match(path))
 
 
 if __name__ == "__main__":